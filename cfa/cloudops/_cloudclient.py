@@ -2,6 +2,7 @@ import datetime
 import inspect
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from graphlib import CycleError, TopologicalSorter
 from typing import Literal, Optional
 
@@ -60,6 +61,9 @@ class CloudClient:
             Default is False.
         use_federated (bool, optional): Whether to use federated/default credentials.
             Default is False.
+        transport (HttpTransport, optional): azure-core HTTP transport shared by the
+            Batch, Compute and Blob clients, e.g. to reuse pooled connections across
+            several CloudClient instances. Default is None (each client creates its own).
         **kwargs: Additional keyword arguments passed to the credential handler.
 
     Attributes:
@@ -101,6 +105,7 @@ class CloudClient:
         use_sp: bool = False,
         use_federated: bool = False,
         force_keyvault: bool = False,
+        transport=None,
         **kwargs,
     ):
         logger.debug("Initializing CloudClient.")
@@ -141,10 +146,13 @@ class CloudClient:
             logger.info("Using service principal credentials.")
         # get clients
         logger.debug("Getting Azure clients and setting other attributes.")
-        self.batch_mgmt_client = get_batch_management_client(self.cred)
-        self.compute_mgmt_client = get_compute_management_client(self.cred)
-        self.batch_service_client = get_batch_service_client(self.cred)
-        self.blob_service_client = get_blob_service_client(self.cred)
+        client_kwargs = {} if transport is None else {"transport": transport}
+        self.batch_mgmt_client = get_batch_management_client(self.cred, **client_kwargs)
+        self.compute_mgmt_client = get_compute_management_client(
+            self.cred, **client_kwargs
+        )
+        self.batch_service_client = get_batch_service_client(self.cred, **client_kwargs)
+        self.blob_service_client = get_blob_service_client(self.cred, **client_kwargs)
 
         # set other defaults
         self.full_container_name = None
@@ -968,7 +976,11 @@ class CloudClient:
         return tid
 
     def add_task_collection(
-        self, job_name: str, tasks: list[dict], name_suffix: str = ""
+        self,
+        job_name: str,
+        tasks: list[dict],
+        name_suffix: str = "",
+        max_concurrency: int | None = None,
     ):
         """
         Add a list of tasks to an Azure Batch job.
@@ -990,6 +1002,8 @@ class CloudClient:
                 - full_container_name (str, optional): Container image to use for the task. Default is None.
                 - timeout (int, optional): Maximum time in minutes for the task to run. Default is None.
             name_suffix (str, optional): Suffix to append to the task ID. Default is "".
+            max_concurrency (int, optional): Number of threads to use to send task collection
+                requests of up to 100 tasks each in parallel. Default is None (sequential).
         """
         logger.debug(f"Adding task to job: {job_name}")
         # get pool info for related job
@@ -1049,6 +1063,7 @@ class CloudClient:
                 batch_client=self.batch_service_client,
                 task_id_max=self.task_id_max,
                 task_id_ints=self.task_id_ints,
+                max_concurrency=max_concurrency,
             )
             self.task_id_max += len(tasks)
             logger.info(f"Added {len(tasks)} tasks to job {job_name}.")
@@ -1132,6 +1147,7 @@ class CloudClient:
         location_in_blob: str = ".",
         legal_hold: bool = False,
         immutability_lock_days: int = 0,
+        max_concurrency: int = 1,
     ) -> None:
         """Upload files to an Azure Blob Storage container.
 
@@ -1150,6 +1166,8 @@ class CloudClient:
                 where files should be uploaded. Default is "." (container root).
             legal_hold (bool, optional): Whether to apply a legal hold to the uploaded blobs which prevents deletion or modification of the blobs.
             immutability_lock_days (int, optional): Number of days to set for immutability lock on the uploaded blobs.
+            max_concurrency (int, optional): Maximum number of parallel connections used to
+                upload each large file in blocks. Default is 1.
 
         Example:
             Upload a single file:
@@ -1182,6 +1200,7 @@ class CloudClient:
             remote_root_dir=location_in_blob,
             legal_hold=legal_hold,
             immutability_lock_days=immutability_lock_days,
+            max_concurrency=max_concurrency,
         )
         logger.info(f"Uploaded files to container '{container_name}'.")
 
@@ -2213,19 +2232,22 @@ class CloudClient:
         blob_paths: list[str],
         target: str,
         container_name: str,
+        max_workers: int = 8,
         **kwargs,
     ):
         """Download files or directories from blob storage after a job completes.
 
         Waits for the specified job to complete, then downloads the specified files or
         directories from blob storage to a local target directory. Handles both single
-        files and directories.
+        files and directories. Multiple paths are downloaded concurrently.
 
         Args:
             job_name (str): Name/ID of the job to monitor for completion.
             blob_paths (list[str]): List of blob paths (files or directories) to download.
             target (str): Local directory where files/directories will be downloaded.
             container_name (str): Name of the blob storage container containing the files.
+            max_workers (int, optional): Maximum number of paths to download at once.
+                Default is 8.
             **kwargs: Additional keyword arguments passed to download_folder().
 
         Example:
@@ -2257,8 +2279,7 @@ class CloudClient:
         )
         os.makedirs(target, exist_ok=True)
 
-        logger.debug(f"Beginning iteration over {len(blob_paths)} paths to download.")
-        for path in blob_paths:
+        def download(path):
             logger.debug(f"Processing path: {path}")
             if "." in path:
                 self.download_file(
@@ -2273,6 +2294,16 @@ class CloudClient:
                     container_name=container_name,
                     **kwargs,
                 )
+
+        logger.debug(f"Downloading {len(blob_paths)} paths.")
+        if len(blob_paths) <= 1 or max_workers <= 1:
+            for path in blob_paths:
+                download(path)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(blob_paths))
+            ) as executor:
+                list(executor.map(download, blob_paths))
         logger.info(
             f"Downloaded {len(blob_paths)} paths after job '{job_name}' completed."
         )
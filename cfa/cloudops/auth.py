@@ -5,7 +5,7 @@ Helper functions for Azure authentication.
 import logging
 import os
 from dataclasses import dataclass
-from functools import cached_property, partial
+from functools import cached_property, lru_cache, partial
 
 from azure.common.credentials import ServicePrincipalCredentials
 from azure.core.pipeline import PipelineContext, PipelineRequest
@@ -19,7 +19,8 @@ from azure.identity import (
 from azure.keyvault.secrets import SecretClient
 from azure.mgmt.batch import models as batch_mgmt_models
 from azure.mgmt.resource.subscriptions import SubscriptionClient
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
+from dotenv.main import resolve_variables
 from msrest.authentication import BasicTokenAuthentication
 
 import cfa.cloudops.defaults as d
@@ -35,6 +36,40 @@ from cfa.cloudops.util import ensure_listlike
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _read_dotenv(path: str, mtime_ns: int) -> dict[str, str | None]:
+    """Parse a .env file without interpolation, caching per path and modification time.
+
+    ``${VAR}`` references are left unexpanded here so that they are resolved
+    against the environment at load time rather than when the file was parsed.
+    """
+    return dotenv_values(path, interpolate=False)
+
+
+def _load_dotenv(dotenv_path: str | None, override: bool = True) -> None:
+    """Load a .env file into ``os.environ``, parsing each file version only once.
+
+    Falls back to ``load_dotenv`` when no explicit file is available so that
+    default .env discovery behaves as before.
+
+    Args:
+        dotenv_path (str | None): Path to the .env file.
+        override (bool): Whether values from the file replace existing variables.
+    """
+    if dotenv_path is None or not os.path.isfile(dotenv_path):
+        load_dotenv(dotenv_path=dotenv_path, override=override)
+        return
+    raw_values = _read_dotenv(
+        os.path.abspath(dotenv_path), os.stat(dotenv_path).st_mtime_ns
+    )
+    values = resolve_variables(raw_values.items(), override=override)
+    for key, value in values.items():
+        if value is None:
+            continue
+        if override or key not in os.environ:
+            os.environ[key] = value
+
+
 @dataclass
 class CredentialHandler:
     """Data structure for Azure credentials.
@@ -590,7 +625,7 @@ def load_env_vars(
     mid_cred = ManagedIdentityCredential()
 
     logger.debug("Loading environment variables.")
-    load_dotenv(dotenv_path=dotenv_path, override=True)
+    _load_dotenv(dotenv_path, override=True)
 
     sub_c = SubscriptionClient(mid_cred)
     # pull in account info and save to environment vars
@@ -672,7 +707,7 @@ class SPCredentialHandler(CredentialHandler):
         """
         logger.debug("Initializing SPCredentialHandler.")
         # load env vars, including client secret if available
-        load_dotenv(dotenv_path=dotenv_path, override=True)
+        _load_dotenv(dotenv_path, override=True)
 
         mandatory_environment_variables = [
             "AZURE_TENANT_ID",
@@ -774,7 +809,7 @@ class DefaultCredentialHandler(CredentialHandler):
         """
         logger.debug("Initializing DefaultCredentialHandler.")
         logger.debug("Loading environment variables.")
-        load_dotenv(dotenv_path=dotenv_path)
+        _load_dotenv(dotenv_path, override=False)
         logger.debug(
             "Retrieving Azure subscription information using DefaultCredential."
         )
@@ -1436,6 +1436,7 @@ def add_task_collection(
     batch_client: object | None = None,
     task_id_max: int = 0,
     task_id_ints: bool = False,
+    max_concurrency: int | None = None,
 ) -> batch_models.BatchCreateTaskCollectionResult:
     """Add a list of tasks to an Azure Batch job with comprehensive configuration options.
 
@@ -1471,6 +1472,9 @@ def add_task_collection(
             Defaults to 0.
         task_id_ints (bool): If True, use integer task IDs instead of string-based IDs.
             Defaults to False.
+        max_concurrency (int, optional): Number of threads to use to send the task
+            collection requests (of up to 100 tasks each) in parallel. If None,
+            requests are sent one after another. Defaults to None.
 
     Returns:
         TaskAddCollectionResult: The result of task collection operation
@@ -1609,8 +1613,10 @@ def add_task_collection(
         f"Adding '{len(tasks_to_add)}' to job '{job_name}' in Azure Batch service"
     )
 
-    result = batch_client.create_task_collection(
-        job_name, batch_models.BatchTaskGroup(task_values=tasks_to_add)
+    # create_tasks splits the collection into requests of at most 100 tasks
+    # and resubmits tasks that fail with retryable errors
+    result = batch_client.create_tasks(
+        job_name, tasks_to_add, max_concurrency=max_concurrency
     )
     logger.debug(f"Successfully added {len(tasks_to_add)}' tasks job '{job_name}'")
     return result
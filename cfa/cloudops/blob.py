@@ -116,6 +116,7 @@ def upload_to_storage_container(
     tags: dict = None,
     legal_hold: bool = False,
     immutability_lock_days: int = 0,
+    max_concurrency: int = 1,
 ) -> None:
     """Upload a file or list of files to an Azure blob storage container.
 
@@ -136,6 +137,10 @@ def upload_to_storage_container(
         legal_hold: bool, optional): Whether to apply a legal hold on the uploaded blobs
             which prevents deletion or modification of the blobs. Defaults to False.
         immutability_lock_days: int, optional): Number of days to set immutability lock
+        max_concurrency: Maximum number of parallel connections to use when uploading
+            each file. Files larger than the client's single-put size are uploaded in
+            blocks, which are sent in parallel when this is greater than 1. Defaults
+            to 1, the Azure SDK default.
 
     Raises:
         Exception: If the blob storage container does not exist.
@@ -186,6 +191,7 @@ def upload_to_storage_container(
                 overwrite=True,
                 tags=tags,
                 immutability_policy=immutability_policy,
+                max_concurrency=max_concurrency,
             )
             logger.debug(f"Successfully uploaded '{file_path}'")
             if legal_hold:
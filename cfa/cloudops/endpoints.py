@@ -3,7 +3,9 @@ Helper functions for constructing Azure endpoint URLs.
 """
 
 import logging
-from urllib.parse import quote, urljoin, urlparse, urlunparse
+import re
+from functools import lru_cache
+from urllib.parse import quote, urljoin
 
 import cfa.cloudops.defaults as d
 
@@ -11,11 +13,11 @@ logger = logging.getLogger(__name__)
 
 
 def _construct_https_url(netloc: str, path: str = "") -> str:
-    """Construct a simple https URL via urllib.parse.urlunparse.
+    """Construct a simple https URL, as urllib.parse.urlunparse would.
 
     Args:
-        netloc: netloc value for urlunparse (subdomains and domain).
-        path: path value for urlunparse (path after the domain).
+        netloc: URL netloc (subdomains and domain). URL-encoded before use.
+        path: URL path after the domain. A leading slash is added if missing.
 
     Returns:
         str: The URL, as a string.
@@ -29,27 +31,14 @@ def _construct_https_url(netloc: str, path: str = "") -> str:
         >>> print(url)
         'https://subdomain.example.com'
     """
-    logger.debug(f"Constructing HTTPS URL with netloc: '{netloc}', path: '{path}'")
-
-    quoted_netloc = quote(netloc)
-    logger.debug(f"URL-encoded netloc: '{quoted_netloc}'")
-
-    url_components = [
-        "https",
-        quoted_netloc,
-        path,
-        "",
-        "",
-        "",
-    ]
-    logger.debug(f"URL components: {url_components}")
-
-    constructed_url = urlunparse(url_components)
-    logger.debug(f"Successfully constructed URL: '{constructed_url}'")
-
-    return constructed_url
+    # Same result as urlunparse(("https", quote(netloc), path, "", "", "")),
+    # which prefixes a slash to a non-empty relative path, without its overhead
+    if path and not path.startswith("/"):
+        path = f"/{path}"
+    return f"https://{quote(netloc)}{path}"
 
 
+@lru_cache(maxsize=128)
 def construct_batch_endpoint(
     batch_account: str,
     batch_location: str,
@@ -92,6 +81,7 @@ def construct_batch_endpoint(
     return endpoint_url
 
 
+@lru_cache(maxsize=128)
 def construct_azure_container_registry_endpoint(
     azure_container_registry_account: str,
     azure_container_registry_domain: str = d.default_azure_container_registry_domain,
@@ -137,6 +127,7 @@ def construct_azure_container_registry_endpoint(
     return endpoint_url
 
 
+@lru_cache(maxsize=128)
 def construct_blob_account_endpoint(
     blob_account: str,
     blob_endpoint_subdomain: str = d.default_azure_blob_storage_endpoint_subdomain,
@@ -182,6 +173,7 @@ def construct_blob_account_endpoint(
     return endpoint_url
 
 
+@lru_cache(maxsize=128)
 def construct_blob_container_endpoint(
     blob_container: str,
     blob_account: str,
@@ -190,6 +182,8 @@ def construct_blob_container_endpoint(
     """Construct an endpoint URL for a blob storage container.
 
     Constructs the URL from the container name, account name, and endpoint subdomain.
+    Results are cached, since the same container endpoint is typically requested
+    once per task when building many tasks for a job.
 
     Args:
         blob_container: Name of the blob storage container.
@@ -230,6 +224,10 @@ def construct_blob_container_endpoint(
     return container_endpoint
 
 
+# Matches the netloc exactly as urllib.parse.urlparse would extract it
+_NETLOC_RE = re.compile(r"^(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#]*)")
+
+
 def is_valid_acr_endpoint(endpoint: str) -> tuple[bool, str | None]:
     """Check whether an Azure container registry endpoint is valid given CFA ACR configurations.
 
@@ -269,7 +267,8 @@ def is_valid_acr_endpoint(endpoint: str) -> tuple[bool, str | None]:
         return (False, error_msg)
 
     logger.debug("Parsing URL to extract domain information")
-    domain = urlparse(endpoint).netloc
+    match = _NETLOC_RE.match(endpoint)
+    domain = match.group(1) if match else ""
     logger.debug(f"Extracted domain: '{domain}'")
 
     logger.debug("Checking if domain ends with 'azurecr.io'")
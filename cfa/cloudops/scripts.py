@@ -1,11 +1,14 @@
 import argparse
 import datetime
+import functools
 import json
 import logging
+import re
 import sys
-import textwrap
-
-from cfa.cloudops import CloudClient
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
 
 
 def setup_logging():
@@ -30,30 +33,222 @@ logger = logging.getLogger(__name__)
 setup_logging()
 
 
-def hello():
-    parser = argparse.ArgumentParser(description="CloudOps parser")
-    parser.add_argument("--name", type=str, default="World", help="Name to greet")
-    args = parser.parse_args()
-    print(f"Hello, {args.name}!")
+@functools.lru_cache(maxsize=1)
+def _get_transport():
+    """Return an HTTP transport whose connection pool is shared by all script clients.
 
+    The transport does not own its session, so closing any one Azure client does
+    not tear down keep-alive connections still in use by the others.
+    """
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+    from requests.adapters import HTTPAdapter
 
-def create_pool():
-    parser = argparse.ArgumentParser(description="Create a resource pool")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+    return RequestsTransport(session=session, session_owner=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(dotenv_path, use_sp, use_federated):
+    """Return a CloudClient for the given auth options, reusing one already built.
+
+    Script entry points may be driven repeatedly from the same interpreter, so
+    clients are cached per (dotenv_path, use_sp, use_federated) to avoid
+    re-reading the .env file and re-authenticating on every call.
+
+    CloudClient is imported here rather than at module level so that lightweight
+    entry points (``hello``, ``generate_sample_env``, ``--help``) do not pay for
+    importing the Azure SDK stack.
+    """
+    from cfa.cloudops import CloudClient
+
+    return CloudClient(
+        dotenv_path=dotenv_path,
+        use_sp=use_sp,
+        use_federated=use_federated,
+        transport=_get_transport(),
+    )
+
+
+def _parse_mount(value: str) -> dict:
+    """Parse a ``source[:target]`` mount argument into a mount dict."""
+    source, _, target = value.partition(":")
+    if not source:
+        raise argparse.ArgumentTypeError(f"invalid mount '{value}'")
+    return {"source": source, "target": target or source}
+
+
+def _parse_task_range(value: str) -> tuple[int, int]:
+    """Parse a ``START-END`` (or ``START:END``) task id range into an int tuple."""
+    start, sep, end = value.replace(":", "-").partition("-")
+    if sep:
+        try:
+            return int(start), int(end)
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(
+        f"invalid task range '{value}', expected START-END or START:END "
+        "with a '-' or ':' separator"
+    )
+
+
+# Authentication flags shared by every CloudClient-backed script.
+_auth_parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+_auth_parser.add_argument(
+    "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
+)
+_auth_parser.add_argument(
+    "-sp",
+    "--use_sp",
+    action="store_true",
+    help="Use service principal for authentication",
+)
+_auth_parser.add_argument(
+    "-f",
+    "--use_federated",
+    action="store_true",
+    help="Use federated identity for authentication",
+)
+
+
+# Parser descriptions, keyed by entry point function name. Also used to list
+# commands in ``cloudops --help`` without building any parser.
+_DESCRIPTIONS = MappingProxyType(
+    {
+        "hello": "Print a greeting to check the CLI is installed",
+        "create_pool": "Create a resource pool",
+        "create_job": "Create a job",
+        "add_task": "Add a task to a job",
+        "create_blob_container": "Create a blob container",
+        "upload_file": "Upload files to a blob container",
+        "upload_folder": "Upload folder(s) to Blob",
+        "monitor_job": "Monitor a job",
+        "check_job_status": "Check job status",
+        "delete_job": "Delete a job",
+        "package_and_upload_dockerfile": "Package and upload Dockerfile",
+        "upload_docker_image": "Upload Docker image to Azure Container Registry",
+        "download_file": "Download a file from Blob storage",
+        "download_folder": "Download a folder from Blob storage",
+        "delete_pool": "Delete a resource pool",
+        "list_blob_files": "List files in a blob container",
+        "delete_blob_file": "Delete a file from a blob container",
+        "delete_blob_folder": "Delete a folder from a blob container",
+        "download_job_stats": "Download job stats from Blob storage",
+        "download_after_job": "Download files from Blob storage after job completion",
+        "add_tasks_from_yaml": "Add tasks to a job from a YAML file",
+        "check_credentials": "Check CloudClient credentials",
+        "create_job_schedule": "Create a job schedule",
+        "delete_job_schedule": "Delete a job schedule",
+        "resume_job_schedule": "Resume a suspended job schedule",
+        "suspend_job_schedule": "Suspend an active job schedule",
+        "list_available_images": "List available Azure Batch images",
+        "update_blob_protection": "Update legal hold or read-only on blobs",
+        "list_acr_tags": "List tags in an ACR repository",
+        "get_task_status": "Get task status for a job",
+        "get_kv_secret": "Get a secret from Azure Key Vault",
+        "get_all_vm_quotas": "Get all available VM quotas",
+        "get_vm_series_quotas": "Get VM quotas filtered by series",
+        "get_vm_name": "Get a VM name matching selection criteria",
+        "add_task_collection": "Add a task collection to a job",
+        "async_download_folder": "Asynchronously download a folder",
+        "async_upload_folder": "Asynchronously upload folder(s)",
+        "generate_sample_env": "Generate a sample .env file (cloudops-sample.env)",
+    }
+)
+
+
+def _new_parser(description: str) -> argparse.ArgumentParser:
+    """Create a script parser that inherits the shared auth flags.
+
+    Abbreviated long options are disabled, so argparse does not build
+    abbreviation matches on the normal parsing path. ``-h``/``--help`` uses
+    argparse's own help action, so a ``-h`` given as an option value is not
+    mistaken for a help request.
+    """
+    return argparse.ArgumentParser(
+        description=description,
+        parents=[_auth_parser],
+        allow_abbrev=False,
     )
+
+
+def _parse_args(build_parser) -> argparse.Namespace:
+    """Parse ``sys.argv`` with the parser returned by ``build_parser``."""
+    return build_parser().parse_args()
+
+
+# Azure naming rules, checked locally so bad names fail before any API call.
+# Blob containers: 3-63 lowercase letters, digits or single hyphens, plus the
+# reserved root, static website and storage analytics containers.
+_CONTAINER_NAME_RE = re.compile(r"(?!.*--)[a-z0-9][a-z0-9-]{1,61}[a-z0-9]")
+_RESERVED_CONTAINER_NAMES = frozenset({"$root", "$web", "$logs"})
+# Batch jobs: up to 64 letters, digits, hyphens or underscores.
+_JOB_NAME_RE = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def _container_name(value: str) -> str:
+    """Validate a blob container name argument."""
+    if value in _RESERVED_CONTAINER_NAMES:
+        return value
+    if not _CONTAINER_NAME_RE.fullmatch(value):
+        raise argparse.ArgumentTypeError(
+            f"invalid container name '{value}': use 3-63 lowercase letters, "
+            "digits or single hyphens, starting and ending with a letter or digit, "
+            "or one of $root, $web or $logs"
+        )
+    return value
+
+
+def _job_name(value: str) -> str:
+    """Validate a Batch job name argument (spaces are removed by CloudClient)."""
+    if not _JOB_NAME_RE.fullmatch(value.replace(" ", "")):
+        raise argparse.ArgumentTypeError(
+            f"invalid job name '{value}': use up to 64 letters, digits, "
+            "hyphens or underscores"
+        )
+    return value
+
+
+_HELLO_USAGE = "usage: hello [-h] [--name NAME]"
+_HELLO_HELP = f"""{_HELLO_USAGE}
+
+{_DESCRIPTIONS["hello"]}
+
+options:
+  -h, --help   show this help message and exit
+  --name NAME  Name to greet"""
+
+
+def hello():
+    # hello only takes --name, so scan sys.argv directly instead of paying for
+    # an ArgumentParser on every call.
+    name = "World"
+    argv = sys.argv[1:]
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-h", "--help"):
+            print(_HELLO_HELP)
+            return
+        if arg == "--name" and i + 1 < len(argv):
+            name = argv[i + 1]
+            i += 2
+        elif arg.startswith("--name="):
+            name = arg.split("=", 1)[1]
+            i += 1
+        else:
+            print(
+                f"{_HELLO_USAGE}\nhello: error: unrecognized arguments: {arg}",
+                file=sys.stderr,
+            )
+            raise SystemExit(2)
+    print(f"Hello, {name}!")
+
+
+@functools.lru_cache(maxsize=1)
+def _create_pool_parser():
+    parser = _new_parser(_DESCRIPTIONS["create_pool"])
     parser.add_argument(
         "-n",
         "--pool_name",
@@ -65,9 +260,10 @@ def create_pool():
         "-m",
         "--mounts",
         nargs="+",
+        type=_parse_mount,
         required=False,
         default=None,
-        help="List of mount points",
+        help="List of blob containers to mount, as source or source:target",
     )
     parser.add_argument(
         "-c",
@@ -128,19 +324,32 @@ def create_pool():
         action="store_true",
         help="Enable blobfuse caching",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
-    if args.mounts is None:
-        new_mounts = None
-    else:
-        new_mounts = [(m, m) for m in args.mounts]
+    return parser
+
+
+class _CreatePoolArgs(NamedTuple):
+    dotenv_path: str | None
+    use_sp: bool
+    use_federated: bool
+    pool_name: str
+    mounts: list[dict] | None
+    container_image_name: str
+    vm_size: str
+    autoscale: bool
+    dedicated_nodes: int
+    low_priority_nodes: int
+    max_autoscale_nodes: int
+    task_slots_per_node: int
+    availability_zones: str
+    cache_blobfuse: bool
+
+
+def create_pool():
+    args = _CreatePoolArgs(**vars(_parse_args(_create_pool_parser)))
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.create_pool(
         pool_name=args.pool_name,
-        mounts=new_mounts,
+        mounts=args.mounts,
         container_image_name=args.container_image_name,
         vm_size=args.vm_size,
         autoscale=args.autoscale,
@@ -153,27 +362,13 @@ def create_pool():
     )
 
 
-def create_job():
-    parser = argparse.ArgumentParser(description="Create a job")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _create_job_parser():
+    parser = _new_parser(_DESCRIPTIONS["create_job"])
     parser.add_argument(
         "-n",
         "--job_name",
-        type=str,
+        type=_job_name,
         required=True,
         help="Name of the job",
     )
@@ -235,12 +430,28 @@ def create_job():
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose output"
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+class _CreateJobArgs(NamedTuple):
+    dotenv_path: str | None
+    use_sp: bool
+    use_federated: bool
+    job_name: str
+    pool_name: str
+    save_logs_to_blob: str | None
+    logs_folder: str | None
+    task_retries: int
+    mark_complete: bool
+    task_id_ints: bool
+    timeout: int | None
+    exist_ok: bool
+    verbose: bool
+
+
+def create_job():
+    args = _CreateJobArgs(**vars(_parse_args(_create_job_parser)))
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.create_job(
         job_name=args.job_name,
         pool_name=args.pool_name,
@@ -255,27 +466,13 @@ def create_job():
     )
 
 
-def add_task():
-    parser = argparse.ArgumentParser(description="Add a task to a job")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _add_task_parser():
+    parser = _new_parser(_DESCRIPTIONS["add_task"])
     parser.add_argument(
         "-jn",
         "--job_name",
-        type=str,
+        type=_job_name,
         required=True,
         help="Name of the job to add the task to",
     )
@@ -303,9 +500,10 @@ def add_task():
     parser.add_argument(
         "-dr",
         "--depends_on_range",
-        type=str,
+        type=_parse_task_range,
         default=None,
-        help="Range of task dependencies",
+        metavar="START-END",
+        help="Range of task dependencies, e.g. 1-10",
     )
     parser.add_argument(
         "-r",
@@ -327,13 +525,12 @@ def add_task():
         default=None,
         help="Task timeout in seconds",
     )
+    return parser
 
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+
+def add_task():
+    args = _parse_args(_add_task_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.add_task(
         job_name=args.job_name,
         command_line=args.command_line,
@@ -346,68 +543,39 @@ def add_task():
     )
 
 
-def create_blob_container():
-    parser = argparse.ArgumentParser(description="Create a blob container")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _create_blob_container_parser():
+    parser = _new_parser(_DESCRIPTIONS["create_blob_container"])
     parser.add_argument(
         "-c",
         "--container_name",
-        type=str,
+        type=_container_name,
         required=True,
         help="Name of the blob container to create",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def create_blob_container():
+    args = _parse_args(_create_blob_container_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.create_blob_container(container_name=args.container_name)
 
 
-def upload_file():
-    parser = argparse.ArgumentParser(description="Upload files to a blob container")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _upload_file_parser():
+    parser = _new_parser(_DESCRIPTIONS["upload_file"])
     parser.add_argument(
         "-s",
         "--source_path",
-        type=str,
+        nargs="+",
         required=True,
-        help="Path to the source file",
+        help="Path(s) to the source file(s)",
     )
-
     parser.add_argument(
         "-c",
         "--container_name",
-        type=str,
+        type=_container_name,
         required=True,
         help="Name of the blob container to upload files to",
     )
@@ -426,37 +594,40 @@ def upload_file():
         default=".",
         help="Destination path in the blob container",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
-    client.upload_files(
-        files=args.source_path,
-        container_name=args.container_name,
-        local_root_dir=args.local_root_dir,
-        location_in_blob=args.location_in_blob,
+    parser.add_argument(
+        "-w",
+        "--max_workers",
+        type=int,
+        default=8,
+        help="Maximum number of files to upload concurrently",
     )
+    return parser
 
 
-def upload_folder():
-    parser = argparse.ArgumentParser(description="Upload folder(s) to Blob")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+def upload_file():
+    args = _parse_args(_upload_file_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
+
+    def upload(source_path):
+        client.upload_files(
+            files=source_path,
+            container_name=args.container_name,
+            local_root_dir=args.local_root_dir,
+            location_in_blob=args.location_in_blob,
+        )
+
+    if len(args.source_path) == 1:
+        upload(args.source_path[0])
+        return
+    # uploads are I/O bound, so overlap them on a thread pool
+    max_workers = max(1, min(args.max_workers, len(args.source_path)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(upload, args.source_path))
+
+
+@functools.lru_cache(maxsize=1)
+def _upload_folder_parser():
+    parser = _new_parser(_DESCRIPTIONS["upload_folder"])
     parser.add_argument(
         "-n",
         "--folder_name",
@@ -467,7 +638,7 @@ def upload_folder():
     parser.add_argument(
         "-c",
         "--container_name",
-        type=str,
+        type=_container_name,
         required=True,
         help="Name of the blob container to upload folders to",
     )
@@ -505,12 +676,12 @@ def upload_folder():
         action="store_true",
         help="Allow upload to create location_in_blob if it does not already exist",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def upload_folder():
+    args = _parse_args(_upload_folder_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.upload_folders(
         folder_names=args.folder_name,
         container_name=args.container_name,
@@ -522,27 +693,13 @@ def upload_folder():
     )
 
 
-def monitor_job():
-    parser = argparse.ArgumentParser(description="Monitor a job")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _monitor_job_parser():
+    parser = _new_parser(_DESCRIPTIONS["monitor_job"])
     parser.add_argument(
         "-n",
         "--job_name",
-        type=str,
+        type=_job_name,
         required=True,
         help="Name of the job to monitor",
     )
@@ -559,12 +716,12 @@ def monitor_job():
         action="store_true",
         help="Download job statistics",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def monitor_job():
+    args = _parse_args(_monitor_job_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.monitor_job(
         job_name=args.job_name,
         timeout=args.timeout,
@@ -572,89 +729,47 @@ def monitor_job():
     )
 
 
-def check_job_status():
-    parser = argparse.ArgumentParser(description="Check job status")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _check_job_status_parser():
+    parser = _new_parser(_DESCRIPTIONS["check_job_status"])
     parser.add_argument(
         "-n",
         "--job_name",
-        type=str,
+        type=_job_name,
         required=True,
         help="Name of the job to check status for",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def check_job_status():
+    args = _parse_args(_check_job_status_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     print(client.check_job_status(job_name=args.job_name))
 
 
-def delete_job():
-    parser = argparse.ArgumentParser(description="Delete a job")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _delete_job_parser():
+    parser = _new_parser(_DESCRIPTIONS["delete_job"])
     parser.add_argument(
         "-n",
         "--job_name",
-        type=str,
+        type=_job_name,
         required=True,
         help="Name of the job to delete",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def delete_job():
+    args = _parse_args(_delete_job_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.delete_job(job_name=args.job_name)
 
 
-def package_and_upload_dockerfile():
-    parser = argparse.ArgumentParser(description="Package and upload Dockerfile")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _package_and_upload_dockerfile_parser():
+    parser = _new_parser(_DESCRIPTIONS["package_and_upload_dockerfile"])
     parser.add_argument(
         "-r",
         "--registry_name",
@@ -690,12 +805,12 @@ def package_and_upload_dockerfile():
         action="store_true",
         help="Use device code for authentication",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def package_and_upload_dockerfile():
+    args = _parse_args(_package_and_upload_dockerfile_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.package_and_upload_dockerfile(
         registry_name=args.registry_name,
         repo_name=args.repo_name,
@@ -705,25 +820,9 @@ def package_and_upload_dockerfile():
     )
 
 
-def upload_docker_image():
-    parser = argparse.ArgumentParser(
-        description="Upload Docker image to Azure Container Registry"
-    )
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _upload_docker_image_parser():
+    parser = _new_parser(_DESCRIPTIONS["upload_docker_image"])
     parser.add_argument(
         "-i",
         "--image_name",
@@ -758,12 +857,12 @@ def upload_docker_image():
         action="store_true",
         help="Use device code for authentication",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def upload_docker_image():
+    args = _parse_args(_upload_docker_image_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.upload_docker_image(
         image_name=args.image_name,
         registry_name=args.registry_name,
@@ -773,27 +872,13 @@ def upload_docker_image():
     )
 
 
-def download_file():
-    parser = argparse.ArgumentParser(description="Download a file from Blob storage")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _download_file_parser():
+    parser = _new_parser(_DESCRIPTIONS["download_file"])
     parser.add_argument(
         "-c",
         "--container_name",
-        type=str,
+        type=_container_name,
         required=True,
         help="Name of the blob container to download the file from",
     )
@@ -817,12 +902,12 @@ def download_file():
         action="store_true",
         help="Check file size before downloading",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def download_file():
+    args = _parse_args(_download_file_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.download_file(
         src_path=args.blob_name,
         dest_path=args.destination_path,
@@ -832,23 +917,9 @@ def download_file():
     )
 
 
-def download_folder():
-    parser = argparse.ArgumentParser(description="Download a folder from Blob storage")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _download_folder_parser():
+    parser = _new_parser(_DESCRIPTIONS["download_folder"])
     parser.add_argument(
         "-s",
         "--src_path",
@@ -866,7 +937,7 @@ def download_folder():
     parser.add_argument(
         "-c",
         "--container_name",
-        type=str,
+        type=_container_name,
         required=True,
         help="Name of the blob container to download the folder from",
     )
@@ -895,12 +966,12 @@ def download_folder():
         action="store_true",
         help="Check file size before downloading",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def download_folder():
+    args = _parse_args(_download_folder_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.download_folder(  # type: ignore
         src_path=args.src_path,
         dest_path=args.dest_path,
@@ -912,23 +983,9 @@ def download_folder():
     )
 
 
-def delete_pool():
-    parser = argparse.ArgumentParser(description="Delete a resource pool")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _delete_pool_parser():
+    parser = _new_parser(_DESCRIPTIONS["delete_pool"])
     parser.add_argument(
         "-n",
         "--pool_name",
@@ -936,71 +993,43 @@ def delete_pool():
         required=True,
         help="Name of the resource pool to delete",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def delete_pool():
+    args = _parse_args(_delete_pool_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.delete_pool(pool_name=args.pool_name)
 
 
-def list_blob_files():
-    parser = argparse.ArgumentParser(description="List files in a blob container")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _list_blob_files_parser():
+    parser = _new_parser(_DESCRIPTIONS["list_blob_files"])
     parser.add_argument(
         "-c",
         "--container_name",
-        type=str,
+        type=_container_name,
         required=True,
         help="Name of the blob container to list files from",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def list_blob_files():
+    args = _parse_args(_list_blob_files_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     files = client.list_blob_files(blob_container=args.container_name)
     for file in files:
         print(file)
 
 
-def delete_blob_file():
-    parser = argparse.ArgumentParser(description="Delete a file from a blob container")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _delete_blob_file_parser():
+    parser = _new_parser(_DESCRIPTIONS["delete_blob_file"])
     parser.add_argument(
         "-c",
         "--container_name",
-        type=str,
+        type=_container_name,
         required=True,
         help="Name of the blob container to delete the file from",
     )
@@ -1011,40 +1040,24 @@ def delete_blob_file():
         required=True,
         help="Name of the blob to delete",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def delete_blob_file():
+    args = _parse_args(_delete_blob_file_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.delete_blob_file(
         container_name=args.container_name, blob_name=args.blob_name
     )
 
 
-def delete_blob_folder():
-    parser = argparse.ArgumentParser(
-        description="Delete a folder from a blob container"
-    )
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _delete_blob_folder_parser():
+    parser = _new_parser(_DESCRIPTIONS["delete_blob_folder"])
     parser.add_argument(
         "-c",
         "--container_name",
-        type=str,
+        type=_container_name,
         required=True,
         help="Name of the blob container to delete the folder from",
     )
@@ -1055,38 +1068,24 @@ def delete_blob_folder():
         required=True,
         help="Name of the blob folder to delete",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def delete_blob_folder():
+    args = _parse_args(_delete_blob_folder_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.delete_blob_folder(
         container_name=args.container_name, folder_path=args.blob_folder_name
     )
 
 
-def download_job_stats():
-    parser = argparse.ArgumentParser(description="Download job stats from Blob storage")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _download_job_stats_parser():
+    parser = _new_parser(_DESCRIPTIONS["download_job_stats"])
     parser.add_argument(
         "-j",
         "--job_name",
-        type=str,
+        type=_job_name,
         required=True,
         help="Name of the job to download stats for",
     )
@@ -1098,38 +1097,22 @@ def download_job_stats():
         required=False,
         help="path to the downloaded file",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def download_job_stats():
+    args = _parse_args(_download_job_stats_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.download_job_stats(job_name=args.job_name, file_name=args.file_name)
 
 
-def download_after_job():
-    parser = argparse.ArgumentParser(
-        description="Download files from Blob storage after job completion"
-    )
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _download_after_job_parser():
+    parser = _new_parser(_DESCRIPTIONS["download_after_job"])
     parser.add_argument(
         "-j",
         "--job_name",
-        type=str,
+        type=_job_name,
         required=True,
         help="Name of the job to monitor and download files after completion",
     )
@@ -1150,46 +1133,39 @@ def download_after_job():
     parser.add_argument(
         "-c",
         "--container_name",
-        type=str,
+        type=_container_name,
         required=True,
         help="Name of the blob container to download the file from",
     )
-
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
+    parser.add_argument(
+        "-w",
+        "--max_workers",
+        type=int,
+        default=8,
+        help="Maximum number of blob paths to download concurrently",
     )
+    return parser
+
+
+def download_after_job():
+    args = _parse_args(_download_after_job_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.download_after_job(
         job_name=args.job_name,
         blob_paths=args.blob_paths,
         target=args.target,
         container_name=args.container_name,
+        max_workers=args.max_workers,
     )
 
 
-def add_tasks_from_yaml():
-    parser = argparse.ArgumentParser(description="Add tasks to a job from a YAML file")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _add_tasks_from_yaml_parser():
+    parser = _new_parser(_DESCRIPTIONS["add_tasks_from_yaml"])
     parser.add_argument(
         "-j",
         "--job_name",
-        type=str,
+        type=_job_name,
         required=True,
         help="Name of the job to add tasks to",
     )
@@ -1205,13 +1181,14 @@ def add_tasks_from_yaml():
         "--file_path",
         type=str,
         required=True,
+        help="Path to the YAML file describing the tasks",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def add_tasks_from_yaml():
+    args = _parse_args(_add_tasks_from_yaml_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.add_tasks_from_yaml(
         job_name=args.job_name,
         base_cmd=args.base_cmd,
@@ -1219,49 +1196,21 @@ def add_tasks_from_yaml():
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _check_credentials_parser():
+    parser = _new_parser(_DESCRIPTIONS["check_credentials"])
+    return parser
+
+
 def check_credentials():
-    parser = argparse.ArgumentParser(description="Check CloudClient credentials")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    args = _parse_args(_check_credentials_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.check_credentials()
 
 
-def create_job_schedule():
-    parser = argparse.ArgumentParser(description="Create a job schedule")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _create_job_schedule_parser():
+    parser = _new_parser(_DESCRIPTIONS["create_job_schedule"])
     parser.add_argument("-n", "--job_schedule_name", type=str, required=True)
     parser.add_argument("-pn", "--pool_name", type=str, required=True)
     parser.add_argument("-c", "--command", type=str, required=True)
@@ -1306,12 +1255,12 @@ def create_job_schedule():
         action="store_true",
         help="Enable verbose output",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def create_job_schedule():
+    args = _parse_args(_create_job_schedule_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     start_window = None
     if args.start_window_minutes is not None:
         start_window = datetime.timedelta(minutes=args.start_window_minutes)
@@ -1334,104 +1283,48 @@ def create_job_schedule():
     )
 
 
-def delete_job_schedule():
-    parser = argparse.ArgumentParser(description="Delete a job schedule")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _delete_job_schedule_parser():
+    parser = _new_parser(_DESCRIPTIONS["delete_job_schedule"])
     parser.add_argument("-n", "--job_schedule_id", type=str, required=True)
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def delete_job_schedule():
+    args = _parse_args(_delete_job_schedule_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.delete_job_schedule(job_schedule_id=args.job_schedule_id)
 
 
-def resume_job_schedule():
-    parser = argparse.ArgumentParser(description="Resume a suspended job schedule")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _resume_job_schedule_parser():
+    parser = _new_parser(_DESCRIPTIONS["resume_job_schedule"])
     parser.add_argument("-n", "--job_schedule_id", type=str, required=True)
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def resume_job_schedule():
+    args = _parse_args(_resume_job_schedule_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.resume_job_schedule(job_schedule_id=args.job_schedule_id)
 
 
-def suspend_job_schedule():
-    parser = argparse.ArgumentParser(description="Suspend an active job schedule")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _suspend_job_schedule_parser():
+    parser = _new_parser(_DESCRIPTIONS["suspend_job_schedule"])
     parser.add_argument("-n", "--job_schedule_id", type=str, required=True)
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def suspend_job_schedule():
+    args = _parse_args(_suspend_job_schedule_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.suspend_job_schedule(job_schedule_id=args.job_schedule_id)
 
 
-def list_available_images():
-    parser = argparse.ArgumentParser(description="List available Azure Batch images")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _list_available_images_parser():
+    parser = _new_parser(_DESCRIPTIONS["list_available_images"])
     parser.add_argument(
         "-os",
         "--operating_system",
@@ -1439,45 +1332,29 @@ def list_available_images():
         default=None,
         help="Optional operating system filter (linux/windows)",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def list_available_images():
+    args = _parse_args(_list_available_images_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     for image in client.list_available_images(operating_system=args.operating_system):
         print(image)
 
 
-def update_blob_protection():
-    parser = argparse.ArgumentParser(
-        description="Update legal hold or read-only on blobs"
-    )
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _update_blob_protection_parser():
+    parser = _new_parser(_DESCRIPTIONS["update_blob_protection"])
     parser.add_argument("-s", "--source_path", nargs="+", required=True)
-    parser.add_argument("-c", "--container_name", type=str, required=True)
+    parser.add_argument("-c", "--container_name", type=_container_name, required=True)
     parser.add_argument("-lh", "--legal_hold", action="store_true")
     parser.add_argument("-ro", "--read_only", action="store_true")
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def update_blob_protection():
+    args = _parse_args(_update_blob_protection_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     files = args.source_path if len(args.source_path) > 1 else args.source_path[0]
     client.update_blob_protection(
         files=files,
@@ -1487,90 +1364,48 @@ def update_blob_protection():
     )
 
 
-def list_acr_tags():
-    parser = argparse.ArgumentParser(description="List tags in an ACR repository")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _list_acr_tags_parser():
+    parser = _new_parser(_DESCRIPTIONS["list_acr_tags"])
     parser.add_argument("-r", "--registry_name", type=str, required=True)
     parser.add_argument("-n", "--repo_name", type=str, required=True)
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def list_acr_tags():
+    args = _parse_args(_list_acr_tags_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     for tag in client.list_acr_tags(
         registry_name=args.registry_name, repo_name=args.repo_name
     ):
         print(tag)
 
 
-def get_task_status():
-    parser = argparse.ArgumentParser(description="Get task status for a job")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
-    parser.add_argument("-j", "--job_name", type=str, required=True)
+@functools.lru_cache(maxsize=1)
+def _get_task_status_parser():
+    parser = _new_parser(_DESCRIPTIONS["get_task_status"])
+    parser.add_argument("-j", "--job_name", type=_job_name, required=True)
     parser.add_argument("-t", "--task_id", type=str, default=None)
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def get_task_status():
+    args = _parse_args(_get_task_status_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     print(client.get_task_status(job_name=args.job_name, task_id=args.task_id))
 
 
-def get_kv_secret():
-    parser = argparse.ArgumentParser(description="Get a secret from Azure Key Vault")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _get_kv_secret_parser():
+    parser = _new_parser(_DESCRIPTIONS["get_kv_secret"])
     parser.add_argument("-s", "--secret_name", type=str, required=True)
     parser.add_argument("-k", "--keyvault", type=str, required=True)
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def get_kv_secret():
+    args = _parse_args(_get_kv_secret_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     secret = client.get_kv_secret(secret_name=args.secret_name, keyvault=args.keyvault)
     with open(f"{args.secret_name}_secret.txt", "a") as f:
         f.write(secret)
@@ -1579,50 +1414,22 @@ def get_kv_secret():
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _get_all_vm_quotas_parser():
+    parser = _new_parser(_DESCRIPTIONS["get_all_vm_quotas"])
+    return parser
+
+
 def get_all_vm_quotas():
-    parser = argparse.ArgumentParser(description="Get all available VM quotas")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    args = _parse_args(_get_all_vm_quotas_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     for quota in client.get_all_vm_quotas():
         print(quota)
 
 
-def get_vm_series_quotas():
-    parser = argparse.ArgumentParser(description="Get VM quotas filtered by series")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _get_vm_series_quotas_parser():
+    parser = _new_parser(_DESCRIPTIONS["get_vm_series_quotas"])
     parser.add_argument(
         "-s",
         "--series",
@@ -1630,36 +1437,20 @@ def get_vm_series_quotas():
         required=True,
         help="VM series values, e.g., D E",
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def get_vm_series_quotas():
+    args = _parse_args(_get_vm_series_quotas_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     series = args.series if len(args.series) > 1 else args.series[0]
     for quota in client.get_vm_series_quotas(series=series):
         print(quota)
 
 
-def get_vm_name():
-    parser = argparse.ArgumentParser(
-        description="Get a VM name matching selection criteria"
-    )
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _get_vm_name_parser():
+    parser = _new_parser(_DESCRIPTIONS["get_vm_name"])
     parser.add_argument("-s", "--series", type=str, default="D")
     parser.add_argument("-c", "--cores", type=int, default=4)
     parser.add_argument("-amd", "--amd", action="store_true")
@@ -1667,12 +1458,12 @@ def get_vm_name():
     parser.add_argument("-ssd", "--ssd", action="store_true")
     parser.add_argument("-v", "--version", type=int, default=5)
     parser.add_argument("-nv", "--no_verify", action="store_true")
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def get_vm_name():
+    args = _parse_args(_get_vm_name_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     print(
         client.get_vm_name(
             series=args.series,
@@ -1686,24 +1477,10 @@ def get_vm_name():
     )
 
 
-def add_task_collection():
-    parser = argparse.ArgumentParser(description="Add a task collection to a job")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
-    parser.add_argument("-j", "--job_name", type=str, required=True)
+@functools.lru_cache(maxsize=1)
+def _add_task_collection_parser():
+    parser = _new_parser(_DESCRIPTIONS["add_task_collection"])
+    parser.add_argument("-j", "--job_name", type=_job_name, required=True)
     parser.add_argument(
         "-tf",
         "--tasks_file",
@@ -1712,16 +1489,16 @@ def add_task_collection():
         help="Path to JSON file containing a list of task objects",
     )
     parser.add_argument("-n", "--name_suffix", type=str, default="")
-    args = parser.parse_args()
+    return parser
+
+
+def add_task_collection():
+    args = _parse_args(_add_task_collection_parser)
 
     with open(args.tasks_file, "r") as f:
         tasks = json.load(f)
 
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.add_task_collection(
         job_name=args.job_name,
         tasks=tasks,
@@ -1729,26 +1506,12 @@ def add_task_collection():
     )
 
 
-def async_download_folder():
-    parser = argparse.ArgumentParser(description="Asynchronously download a folder")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _async_download_folder_parser():
+    parser = _new_parser(_DESCRIPTIONS["async_download_folder"])
     parser.add_argument("-s", "--src_path", type=str, required=True)
     parser.add_argument("-d", "--dest_path", type=str, required=True)
-    parser.add_argument("-c", "--container_name", type=str, required=True)
+    parser.add_argument("-c", "--container_name", type=_container_name, required=True)
     parser.add_argument("-i", "--include_extensions", nargs="+", default=None)
     parser.add_argument("-e", "--exclude_extensions", nargs="+", default=None)
     parser.add_argument("-check", "--check_size", action="store_true")
@@ -1758,12 +1521,12 @@ def async_download_folder():
         type=int,
         default=20,
     )
-    args = parser.parse_args()
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    return parser
+
+
+def async_download_folder():
+    args = _parse_args(_async_download_folder_parser)
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.async_download_folder(
         src_path=args.src_path,
         dest_path=args.dest_path,
@@ -1775,23 +1538,9 @@ def async_download_folder():
     )
 
 
-def async_upload_folder():
-    parser = argparse.ArgumentParser(description="Asynchronously upload folder(s)")
-    parser.add_argument(
-        "-p", "--dotenv_path", type=str, default=None, help="Path to .env file"
-    )
-    parser.add_argument(
-        "-sp",
-        "--use_sp",
-        action="store_true",
-        help="Use service principal for authentication",
-    )
-    parser.add_argument(
-        "-f",
-        "--use_federated",
-        action="store_true",
-        help="Use federated identity for authentication",
-    )
+@functools.lru_cache(maxsize=1)
+def _async_upload_folder_parser():
+    parser = _new_parser(_DESCRIPTIONS["async_upload_folder"])
     parser.add_argument(
         "-n",
         "--folders",
@@ -1799,7 +1548,7 @@ def async_upload_folder():
         required=True,
         help="Folder path(s) to upload",
     )
-    parser.add_argument("-c", "--container_name", type=str, required=True)
+    parser.add_argument("-c", "--container_name", type=_container_name, required=True)
     parser.add_argument("-i", "--include_extensions", nargs="+", default=None)
     parser.add_argument("-e", "--exclude_extensions", nargs="+", default=None)
     parser.add_argument("-l", "--location_in_blob", type=str, default=".")
@@ -1812,13 +1561,13 @@ def async_upload_folder():
     parser.add_argument("-lh", "--legal_hold", action="store_true")
     parser.add_argument("-ild", "--immutability_lock_days", type=int, default=0)
     parser.add_argument("-ro", "--read_only", action="store_true")
-    args = parser.parse_args()
+    return parser
+
+
+def async_upload_folder():
+    args = _parse_args(_async_upload_folder_parser)
     folders = args.folders if len(args.folders) > 1 else args.folders[0]
-    client = CloudClient(
-        dotenv_path=args.dotenv_path,
-        use_sp=args.use_sp,
-        use_federated=args.use_federated,
-    )
+    client = _get_client(args.dotenv_path, args.use_sp, args.use_federated)
     client.async_upload_folder(
         folders=folders,
         container_name=args.container_name,
@@ -1832,33 +1581,105 @@ def async_upload_folder():
     )
 
 
+_SAMPLE_ENV_TEXT = """
+# This file is saved as cloudops-sample.env. Rename it to .env (or your desired name) and fill in the values.
+
+# Azure account info
+AZURE_BATCH_ACCOUNT="your azure batch account name"
+AZURE_BATCH_LOCATION="azure batch location"
+AZURE_USER_ASSIGNED_IDENTITY="/subscriptions/xxxxxxxxx/resourcegroups/xxxxxxxx/Microsoft.ManagedIdentity/userAssignedIdentities/xxxxxxxxxx"
+AZURE_SUBNET_ID="/subscriptions/xxxxxxxx/resourceGroups/xxxxxxxx/providers/Microsoft.Network/virtualNetworks/xxxxxxxx/subnets/xxxxxxxx"
+AZURE_SP_CLIENT_ID="your sp client id"
+AZURE_KEYVAULT_NAME="your keyvault name"
+AZURE_KEYVAULT_SP_SECRET_ID="your keyvault secret id"
+
+# Azure Blob storage config
+AZURE_BLOB_STORAGE_ACCOUNT="your azure blob storage account"
+
+# Azure container registry config
+AZURE_CONTAINER_REGISTRY_ACCOUNT="your azure container registry name"
+"""
+# Encoded once at import so generate_sample_env is a single binary write.
+_SAMPLE_ENV_BYTES = (_SAMPLE_ENV_TEXT.strip() + "\n").encode()
+
+
 def generate_sample_env():
-    text = """
-    # This file is saved as cloudops-sample.env. Rename it to .env (or your desired name) and fill in the values.
-
-    # Azure account info
-    AZURE_BATCH_ACCOUNT="your azure batch account name"
-    AZURE_BATCH_LOCATION="azure batch location"
-    AZURE_USER_ASSIGNED_IDENTITY="/subscriptions/xxxxxxxxx/resourcegroups/xxxxxxxx/Microsoft.ManagedIdentity/userAssignedIdentities/xxxxxxxxxx"
-    AZURE_SUBNET_ID="/subscriptions/xxxxxxxx/resourceGroups/xxxxxxxx/providers/Microsoft.Network/virtualNetworks/xxxxxxxx/subnets/xxxxxxxx"
-    AZURE_SP_CLIENT_ID="your sp client id"
-    AZURE_KEYVAULT_NAME="your keyvault name"
-    AZURE_KEYVAULT_SP_SECRET_ID="your keyvault secret id"
-
-    # Azure Blob storage config
-    AZURE_BLOB_STORAGE_ACCOUNT="your azure blob storage account"
-
-    # Azure container registry config
-    AZURE_CONTAINER_REGISTRY_ACCOUNT="your azure container registry name"
-    """
     try:
-        with open("cloudops-sample.env", "w") as file:
-            file.write(textwrap.dedent(text).strip() + "\n")
+        Path("cloudops-sample.env").write_bytes(_SAMPLE_ENV_BYTES)
         print("Sample .env file 'cloudops-sample.env' created successfully.")
     except Exception as e:
         print(f"Error creating sample .env file: {e}")
 
 
+# Subcommands exposed through the ``cloudops`` entry point. Values are the
+# per-command entry functions, each of which builds only its own parser.
+_COMMANDS = {
+    "hello": hello,
+    "create_pool": create_pool,
+    "create_job": create_job,
+    "create_job_schedule": create_job_schedule,
+    "add_task": add_task,
+    "create_blob_container": create_blob_container,
+    "upload_file": upload_file,
+    "upload_folder": upload_folder,
+    "monitor_job": monitor_job,
+    "check_job_status": check_job_status,
+    "delete_job": delete_job,
+    "delete_job_schedule": delete_job_schedule,
+    "package_and_upload_dockerfile": package_and_upload_dockerfile,
+    "upload_docker_image": upload_docker_image,
+    "download_file": download_file,
+    "download_folder": download_folder,
+    "delete_pool": delete_pool,
+    "list_blob_files": list_blob_files,
+    "delete_blob_file": delete_blob_file,
+    "delete_blob_folder": delete_blob_folder,
+    "download_job_stats": download_job_stats,
+    "download_after_job": download_after_job,
+    "add_tasks_from_yaml": add_tasks_from_yaml,
+    "generate_sample_env": generate_sample_env,
+    "resume_schedule": resume_job_schedule,
+    "suspend_schedule": suspend_job_schedule,
+    "check_credentials": check_credentials,
+    "list_available_images": list_available_images,
+    "update_blob_protection": update_blob_protection,
+    "list_acr_tags": list_acr_tags,
+    "get_task_status": get_task_status,
+    "get_kv_secret": get_kv_secret,
+    "get_all_vm_quotas": get_all_vm_quotas,
+    "get_vm_series_quotas": get_vm_series_quotas,
+    "get_vm_name": get_vm_name,
+    "add_task_collection": add_task_collection,
+    "async_download_folder": async_download_folder,
+    "async_upload_folder": async_upload_folder,
+}
+
+
+def main():
+    """Dispatch ``cloudops <command> [args...]`` to the matching entry point.
+
+    Only the parser for the selected command is constructed, so startup cost
+    does not grow with the number of available commands.
+    """
+    usage = "usage: cloudops <command> [args...]"
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
+        print(usage)
+        print("\ncommands:")
+        for name, command in _COMMANDS.items():
+            print(f"  {name:<31} {_DESCRIPTIONS[command.__name__]}")
+        return
+    name = sys.argv[1].replace("-", "_")
+    command = _COMMANDS.get(name)
+    if command is None:
+        print(
+            f"{usage}\ncloudops: error: unknown command '{sys.argv[1]}'",
+            file=sys.stderr,
+        )
+        raise SystemExit(2)
+    sys.argv = [f"{sys.argv[0]} {name}", *sys.argv[2:]]
+    command()
+
+
 def test():
     try:
         import pytest
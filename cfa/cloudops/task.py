@@ -4,8 +4,14 @@ Azure batch job.
 """
 
 import logging
-from pathlib import Path
-
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from pathlib import PurePosixPath
+
+import anyio
 import azure.mgmt.batch.models as batch_mgmt_models
 
 # 15.0.0+ model names use Batch prefix
@@ -13,6 +19,7 @@ from azure.batch import models as batchmodels
 from azure.batch.models import (
     AutoUserScope,
     AutoUserSpecification,
+    BatchCreateTaskCollectionResult,
     BatchNodeIdentityReference,
     BatchTaskContainerSettings,
     BatchTaskCreateOptions,
@@ -27,10 +34,52 @@ from azure.batch.models import (
 from .auth import get_compute_node_identity_reference
 from .defaults import default_azure_blob_storage_endpoint_subdomain
 from .endpoints import construct_blob_container_endpoint
-from .util import ensure_listlike
+from .util import _coerce_pair
 
 logger = logging.getLogger(__name__)
 
+# Accepted by get_task_config for older callers but not by BatchTaskCreateOptions
+_UNSUPPORTED_TASK_PARAMS = frozenset(
+    {"run_dependent_tasks_on_failure", "run_dependent_tasks_on_fail"}
+)
+
+# Shared by every task built without an explicit user identity. The SDK only
+# reads it when serializing a task, so sharing one instance is safe as long as
+# callers do not modify it in place.
+_DEFAULT_USER_IDENTITY = UserIdentity(
+    auto_user=AutoUserSpecification(
+        scope=AutoUserScope.POOL,
+        elevation_level=ElevationLevel.ADMIN,
+    )
+)
+
+
+@dataclass(slots=True, frozen=True)
+class MountPair:
+    """Source and target directories for a bind mount in a task container.
+
+    A compact alternative to ``{"source": ..., "target": ...}`` dictionaries
+    for describing mounts in get_container_settings.
+
+    Example:
+        >>> pair = MountPair(source="data", target="/app/data")
+        >>> MountPair.from_dict({"source": "data", "target": "/app/data"}) == pair
+        True
+    """
+
+    source: str
+    target: str
+
+    @classmethod
+    def from_dict(cls, pair: dict) -> "MountPair":
+        """Create a MountPair from a dictionary with 'source' and 'target' keys."""
+        return cls(source=pair["source"], target=pair["target"])
+
+
+def _as_mount_pair(pair: MountPair | dict) -> MountPair:
+    """Return ``pair`` as a MountPair, converting it from a dictionary if needed."""
+    return pair if isinstance(pair, MountPair) else MountPair.from_dict(pair)
+
 
 def create_bind_mount_string(
     az_mount_dir: str, source_path: str, target_path: str
@@ -57,25 +106,58 @@ def create_bind_mount_string(
         '--mount type=bind,source=/mnt/batch/tasks/fsmounts/data,target=/app/data'
     """
     logger.debug(
-        f"Creating bind mount string: az_mount_dir='{az_mount_dir}', source_path='{source_path}', target_path='{target_path}'"
+        "Creating bind mount string: az_mount_dir='%s', source_path='%s', target_path='%s'",
+        az_mount_dir,
+        source_path,
+        target_path,
     )
 
-    mount_template = "--mount type=bind,source={}/{},target={}"
-    logger.debug(f"Using mount template: '{mount_template}'")
-
-    mount_string = mount_template.format(az_mount_dir, source_path, target_path)
-    logger.debug(f"Generated bind mount string: '{mount_string}'")
+    mount_string = (
+        f"--mount type=bind,source={az_mount_dir}/{source_path},target={target_path}"
+    )
+    logger.debug("Generated bind mount string: '%s'", mount_string)
 
     return mount_string
 
 
+def create_bind_mount_strings(
+    az_mount_dir: str, mount_pairs: Iterable[MountPair | dict]
+) -> list[str]:
+    """Create OCI bind mount strings for several mounts at once.
+
+    Equivalent to calling create_bind_mount_string for each pair, without the
+    per-mount function call.
+
+    Args:
+        az_mount_dir: Directory in which to look for directories or volumes to mount.
+        mount_pairs: MountPair objects or dictionaries with 'source' and 'target' keys.
+
+    Returns:
+        list[str]: One ``--mount type=bind`` option string per mount pair.
+
+    Example:
+        >>> create_bind_mount_strings(
+        ...     "/mnt/batch/tasks/fsmounts",
+        ...     [MountPair("data", "/app/data"), {"source": "out", "target": "/app/out"}],
+        ... )
+        ['--mount type=bind,source=/mnt/batch/tasks/fsmounts/data,target=/app/data', '--mount type=bind,source=/mnt/batch/tasks/fsmounts/out,target=/app/out']
+    """
+    # The prefix is the same for every mount, so format it once
+    prefix = f"--mount type=bind,source={az_mount_dir}/"
+    return [
+        f"{prefix}{pair.source},target={pair.target}"
+        for pair in map(_as_mount_pair, mount_pairs)
+    ]
+
+
 def get_container_settings(
     container_image_name: str,
     az_mount_dir: str = "/mnt/batch/tasks/fsmounts",
     working_directory: str | batchmodels.ContainerWorkingDirectory | None = None,
-    mount_pairs: list[dict] = None,
+    mount_pairs: list[MountPair | dict] = None,
     additional_options: str = "",
     registry: batchmodels.ContainerRegistryReference = None,
+    cache: bool = True,
     **kwargs,
 ) -> BatchTaskContainerSettings:
     """Create a valid set of container settings with bind mounts for an OCI container.
@@ -95,11 +177,18 @@ def get_container_settings(
             "containerImageDefault" to use the container's own WORKDIR. See the
             documentation for BatchTaskContainerSettings for more details.
         mount_pairs: Pairs of 'source' and 'target' directories to mount when the
-            container is run, as a list of dictionaries with 'source' and 'target' keys.
+            container is run, as a list of MountPair objects or of dictionaries with
+            'source' and 'target' keys.
         additional_options: Additional flags and options to pass to the container
             run command, as a string. Defaults to "".
         registry: ContainerRegistryReference instance specifying a private container registry
             from which to fetch task containers. Defaults to None.
+        cache: If True (the default), return a shared BatchTaskContainerSettings object
+            for repeated calls with the same image, mount directory, working directory,
+            mounts, and options, so homogeneous tasks in a job share one object. Only
+            applies when ``registry`` is None, ``working_directory`` is None or a string,
+            and no ``**kwargs`` are given. Pass False if the returned object will be
+            modified per task.
         **kwargs: Additional keyword arguments passed to the BatchTaskContainerSettings constructor.
 
     Returns:
@@ -119,37 +208,47 @@ def get_container_settings(
         >>> print(settings.image_name)
         'myregistry.azurecr.io/myapp:latest'
     """
-    logger.debug(f"Creating container settings for image: '{container_image_name}'")
+    if (
+        cache
+        and registry is None
+        and not kwargs
+        and (working_directory is None or isinstance(working_directory, str))
+    ):
+        mounts_key = tuple(_as_mount_pair(pair) for pair in mount_pairs or ())
+        return _cached_container_settings(
+            container_image_name,
+            az_mount_dir,
+            working_directory,
+            mounts_key,
+            additional_options,
+        )
+
+    logger.debug("Creating container settings for image: '%s'", container_image_name)
     logger.debug(
-        f"Parameters: az_mount_dir='{az_mount_dir}', working_directory={working_directory}"
+        "Parameters: az_mount_dir='%s', working_directory=%s",
+        az_mount_dir,
+        working_directory,
     )
     logger.debug(
-        f"Mount pairs: {mount_pairs}, additional_options='{additional_options}'"
+        "Mount pairs: %s, additional_options='%s'", mount_pairs, additional_options
     )
 
     if registry:
-        logger.debug(f"Using private container registry: {registry.registry_server}")
+        logger.debug("Using private container registry: %s", registry.registry_server)
     else:
         logger.debug("No private container registry specified, using default registry")
 
-    ctr_r_opts = additional_options
-    logger.debug(f"Starting with base container run options: '{ctr_r_opts}'")
+    run_option_parts = [additional_options] if additional_options else []
+    logger.debug("Starting with base container run options: '%s'", additional_options)
 
     if mount_pairs:
-        logger.debug(f"Processing {len(mount_pairs)} mount pairs")
-        for i, pair in enumerate(mount_pairs):
-            logger.debug(
-                f"Processing mount pair {i + 1}: source='{pair['source']}', target='{pair['target']}'"
-            )
-            mount_string = create_bind_mount_string(
-                az_mount_dir, pair["source"], pair["target"]
-            )
-            ctr_r_opts += " " + mount_string
-            logger.debug(f"Updated container run options: '{ctr_r_opts}'")
+        logger.debug("Processing %s mount pairs", len(mount_pairs))
+        run_option_parts.extend(create_bind_mount_strings(az_mount_dir, mount_pairs))
     else:
         logger.debug("No mount pairs to process")
+    ctr_r_opts = " ".join(run_option_parts)
 
-    logger.debug(f"Final container run options: '{ctr_r_opts}'")
+    logger.debug("Final container run options: '%s'", ctr_r_opts)
 
     container_settings = BatchTaskContainerSettings(
         image_name=container_image_name,
@@ -160,12 +259,93 @@ def get_container_settings(
     )
 
     logger.debug(
-        f"Created BatchTaskContainerSettings with image '{container_image_name}' and {len(ctr_r_opts.split()) if ctr_r_opts else 0} run options"
+        "Created BatchTaskContainerSettings with image '%s' and %s run options",
+        container_image_name,
+        len(ctr_r_opts.split()) if ctr_r_opts else 0,
     )
 
     return container_settings
 
 
+@lru_cache(maxsize=1)
+def _default_compute_node_identity_reference() -> BatchNodeIdentityReference:
+    """Get the default compute node identity reference, looked up once per process."""
+    mgmt_compute_id = get_compute_node_identity_reference()
+    return get_batch_compute_id(mgmt_compute_id)
+
+
+def clear_identity_cache() -> None:
+    """Clear the cached default compute node identity reference.
+
+    The default identity is looked up from the environment once per process.
+    Call this after changing the relevant configuration (e.g. in tests) so the
+    next task config picks up the new value.
+
+    Example:
+        >>> clear_identity_cache()
+    """
+    _default_compute_node_identity_reference.cache_clear()
+
+
+def _validate_compute_node_identity_reference(
+    compute_node_identity_reference: BatchNodeIdentityReference | None,
+) -> BatchNodeIdentityReference:
+    """Resolve and type-check a compute node identity reference.
+
+    Args:
+        compute_node_identity_reference: BatchNodeIdentityReference to check.
+            If None, use the default compute node identity reference.
+
+    Returns:
+        BatchNodeIdentityReference: The validated identity reference.
+
+    Raises:
+        TypeError: If ``compute_node_identity_reference`` is not of the required type.
+    """
+    if compute_node_identity_reference is None:
+        logger.debug("No compute node identity reference provided, obtaining default")
+        compute_node_identity_reference = _default_compute_node_identity_reference()
+        logger.debug("Successfully obtained default compute node identity reference")
+    else:
+        logger.debug("Using provided compute node identity reference")
+
+    logger.debug(
+        "Validating compute node identity reference type: %s",
+        type(compute_node_identity_reference),
+    )
+    if not isinstance(compute_node_identity_reference, BatchNodeIdentityReference):
+        error_msg = (
+            "compute_node_identity_reference "
+            "must be an instance of "
+            "BatchNodeIdentityReference. "
+            f"Got {type(compute_node_identity_reference)}."
+        )
+        logger.debug("Type validation failed: %s", error_msg)
+        raise TypeError(error_msg)
+
+    logger.debug("Compute node identity reference validation successful")
+    return compute_node_identity_reference
+
+
+@lru_cache(maxsize=64)
+def _cached_container_settings(
+    container_image_name: str,
+    az_mount_dir: str,
+    working_directory: str | None,
+    mounts_key: tuple[MountPair, ...],
+    additional_options: str,
+) -> BatchTaskContainerSettings:
+    """Build container settings once per distinct set of hashable arguments."""
+    return get_container_settings(
+        container_image_name,
+        az_mount_dir=az_mount_dir,
+        working_directory=working_directory,
+        mount_pairs=list(mounts_key),
+        additional_options=additional_options,
+        cache=False,
+    )
+
+
 def output_task_files_to_blob(
     file_pattern: str,
     blob_container: str,
@@ -189,7 +369,7 @@ def output_task_files_to_blob(
             the Blob storage container specified in ``blob_container``.
         path: Path within the Blob storage container to which to upload the file(s).
             Passed as the ``path`` argument to the BatchOutputFileBlobContainerDestination
-            constructor. If None, upload to the root of the container. If ``file_pattern``
+            constructor. If None or "", upload to the root of the container. If ``file_pattern``
             contains wildcards, ``path`` gives the subdirectory within the container to
             upload them with their original filenames and extensions. If ``file_pattern``
             contains no wildcards, ``path`` is treated as the full file path including
@@ -205,6 +385,7 @@ def output_task_files_to_blob(
         compute_node_identity_reference: BatchNodeIdentityReference to use when
             constructing a BatchOutputFileBlobContainerDestination object for logging.
             If None (default), attempt to create compute node identity reference.
+            The default is looked up once and reused for subsequent calls.
         **kwargs: Additional keyword arguments passed to the BatchOutputFile constructor.
 
     Returns:
@@ -225,55 +406,42 @@ def output_task_files_to_blob(
         >>> print(output_file.file_pattern)
         '*.log'
     """
-    logger.debug(f"Creating output file configuration for pattern: '{file_pattern}'")
+    logger.debug("Creating output file configuration for pattern: '%s'", file_pattern)
     logger.debug(
-        f"Target blob container: '{blob_container}' in account: '{blob_account}'"
+        "Target blob container: '%s' in account: '%s'", blob_container, blob_account
     )
-    logger.debug(f"Upload path: '{path}', upload condition: '{upload_condition}'")
-    logger.debug(f"Blob endpoint subdomain: '{blob_endpoint_subdomain}'")
+    logger.debug("Upload path: '%s', upload condition: '%s'", path, upload_condition)
+    logger.debug("Blob endpoint subdomain: '%s'", blob_endpoint_subdomain)
 
-    if compute_node_identity_reference is None:
-        logger.debug("No compute node identity reference provided, obtaining default")
-        mgmt_compute_id = get_compute_node_identity_reference()
-        compute_node_identity_reference = get_batch_compute_id(mgmt_compute_id)
-        logger.debug("Successfully obtained default compute node identity reference")
-    else:
-        logger.debug("Using provided compute node identity reference")
+    if not path:
+        # An empty path would be serialized as-is; omit it to mean the container root
+        path = None
 
-    logger.debug(
-        f"Validating compute node identity reference type: {type(compute_node_identity_reference)}"
+    compute_node_identity_reference = _validate_compute_node_identity_reference(
+        compute_node_identity_reference
     )
-    if not isinstance(compute_node_identity_reference, BatchNodeIdentityReference):
-        error_msg = (
-            "compute_node_identity_reference "
-            "must be an instance of "
-            "BatchNodeIdentityReference. "
-            f"Got {type(compute_node_identity_reference)}."
-        )
-        logger.debug(f"Type validation failed: {error_msg}")
-        raise TypeError(error_msg)
-
-    logger.debug("Compute node identity reference validation successful")
 
     container_url = construct_blob_container_endpoint(
         blob_container,
         blob_account,
         blob_endpoint_subdomain,
     )
-    logger.debug(f"Constructed container URL: '{container_url}'")
+    logger.debug("Constructed container URL: '%s'", container_url)
 
     container = OutputFileBlobContainerDestination(
         container_url=container_url,
         path=path,
         identity_reference=compute_node_identity_reference,
     )
-    logger.debug(f"Created BatchOutputFileBlobContainerDestination with path: '{path}'")
+    logger.debug(
+        "Created BatchOutputFileBlobContainerDestination with path: '%s'", path
+    )
 
     destination = OutputFileDestination(container=container)
     logger.debug("Created BatchOutputFileDestination wrapper")
 
     upload_options = OutputFileUploadConfiguration(upload_condition=upload_condition)
-    logger.debug(f"Created upload options with condition: '{upload_condition}'")
+    logger.debug("Created upload options with condition: '%s'", upload_condition)
 
     output_file = OutputFile(
         file_pattern=file_pattern,
@@ -283,12 +451,122 @@ def output_task_files_to_blob(
     )
 
     logger.debug(
-        f"Successfully created BatchOutputFile for pattern '{file_pattern}' -> '{blob_container}/{path or ''}'"
+        "Successfully created BatchOutputFile for pattern '%s' -> '%s/%s'",
+        file_pattern,
+        blob_container,
+        path or "",
     )
 
     return output_file
 
 
+def _log_path_prefix(log_subdir: str | None) -> str:
+    """Normalize a log subdirectory to a POSIX blob path prefix.
+
+    Backslashes are treated as separators, so Windows-style subdirectories
+    give the same blob paths on every platform. Redundant separators and "."
+    segments are removed. The result has no trailing slash and is empty if
+    ``log_subdir`` is None, empty or ".".
+    """
+    if not log_subdir:
+        return ""
+    # Collapses "./", "//" and "/." segments, as Path(log_subdir, task_id) did
+    prefix = PurePosixPath(log_subdir.replace("\\", "/")).as_posix()
+    if prefix == ".":
+        return ""
+    return prefix.rstrip("/")
+
+
+def _join_log_path(prefix: str, task_id: str) -> str:
+    """Join a normalized log path prefix and a task ID into a blob path."""
+    return f"{prefix}/{task_id}" if prefix else task_id
+
+
+def make_log_output_file_factory(
+    log_blob_container: str,
+    log_blob_account: str,
+    log_subdir: str = None,
+    log_file_pattern: str = "../std*.txt",
+    log_upload_condition: str = "taskCompletion",
+    compute_node_identity_reference: BatchNodeIdentityReference = None,
+    blob_endpoint_subdomain: str = default_azure_blob_storage_endpoint_subdomain,
+) -> Callable[[str], OutputFile]:
+    """Get a function that builds the log OutputFile for a task, given its task ID.
+
+    The container URL, identity reference, and upload options are resolved and
+    validated once, so building log output files for many tasks of the same job
+    only constructs the per-task parts. Pass the result to get_task_config as
+    ``log_output_file_factory``.
+    Each call builds new OutputFile and destination objects rather than copying
+    a template: azure-batch 15.x models keep their fields in a shared mapping,
+    so shallow copies would all point at the same ``path``.
+    Requires azure-batch>=15.0.0.
+
+    Args:
+        log_blob_container: Name of the Azure blob storage container to which
+            to upload the logs.
+        log_blob_account: Name of the Azure blob storage account in which to look
+            for ``log_blob_container``.
+        log_subdir: Subdirectory of ``log_blob_container`` in which to save logs.
+            Each task's logs are saved under ``<log_subdir>/<task_id>``. If None,
+            save under ``<task_id>`` at the root of the container.
+        log_file_pattern: File pattern for logs to persist. Defaults to "../std*.txt".
+        log_upload_condition: Condition under which to upload logs. Defaults to
+            "taskCompletion". See output_task_files_to_blob for options.
+        compute_node_identity_reference: BatchNodeIdentityReference to use for
+            uploading. If None (default), use the default compute node identity.
+        blob_endpoint_subdomain: Azure Blob endpoint subdomains and domains that
+            follow the account name. Defaults to this package's
+            default_azure_blob_storage_endpoint_subdomain.
+
+    Returns:
+        Callable[[str], OutputFile]: Function taking a task ID and returning
+            the log OutputFile for that task.
+
+    Example:
+        >>> log_factory = make_log_output_file_factory(
+        ...     log_blob_container="task-logs",
+        ...     log_blob_account="mystorageaccount",
+        ...     log_subdir="job-123",
+        ... )
+        >>> task = get_task_config(
+        ...     task_id="my-task-001",
+        ...     base_call="python /app/script.py",
+        ...     log_output_file_factory=log_factory,
+        ... )
+    """
+    logger.debug(
+        "Creating log output file factory for '%s' in account '%s'",
+        log_blob_container,
+        log_blob_account,
+    )
+    identity_reference = _validate_compute_node_identity_reference(
+        compute_node_identity_reference
+    )
+    container_url = construct_blob_container_endpoint(
+        log_blob_container, log_blob_account, blob_endpoint_subdomain
+    )
+    upload_options = OutputFileUploadConfiguration(
+        upload_condition=log_upload_condition
+    )
+    log_path_prefix = _log_path_prefix(log_subdir)
+
+    def log_output_file_factory(task_id: str) -> OutputFile:
+        return OutputFile(
+            file_pattern=log_file_pattern,
+            destination=OutputFileDestination(
+                container=OutputFileBlobContainerDestination(
+                    container_url=container_url,
+                    path=_join_log_path(log_path_prefix, task_id),
+                    identity_reference=identity_reference,
+                )
+            ),
+            upload_options=upload_options,
+        )
+
+    return log_output_file_factory
+
+
 def get_task_config(
     task_id: str,
     base_call: str,
@@ -301,6 +579,7 @@ def get_task_config(
     log_upload_condition: str = "taskCompletion",
     log_compute_node_identity_reference: BatchNodeIdentityReference = None,
     output_files: list[OutputFile] | OutputFile = None,
+    log_output_file_factory: Callable[[str], OutputFile] = None,
     **kwargs,
 ) -> BatchTaskCreateOptions:
     """Create a batch task with a given base call and set of container settings.
@@ -315,8 +594,10 @@ def get_task_config(
         container_settings: Container settings for the task. You can use the
             create_container_settings helper function to create a valid entry.
             Defaults to None.
-        user_identity: User identity under which to run the task. If None, create
-            one automatically with admin privileges, if permitted. Defaults to None.
+        user_identity: User identity under which to run the task. If None, use a
+            pool-scoped auto user with admin privileges, if permitted. That default
+            UserIdentity object is shared by every task built this way, so it should
+            not be modified in place. Defaults to None.
         log_blob_container: If provided, save the contents of the stderr and stdout
             buffers (default) and/or other specified log files from task execution
             to files named in the specified Azure blob storage container. If None,
@@ -344,6 +625,11 @@ def get_task_config(
             output files for the task beyond those auto-constructed for persisting logs
             to ``log_blob_container``. Passed along with those autogenerated BatchOutputFile
             objects as the ``output_files`` parameter to the BatchTaskCreateOptions constructor.
+        log_output_file_factory: Function returning the log OutputFile for a task ID,
+            as created by make_log_output_file_factory. If provided, it is used instead
+            of ``log_blob_container`` and the other ``log_*`` arguments, which avoids
+            re-deriving the shared log configuration when building many tasks.
+            Defaults to None.
         **kwargs: Additional keyword arguments passed to the BatchTaskCreateOptions constructor.
 
     Returns:
@@ -373,16 +659,17 @@ def get_task_config(
         >>> print(task.id)
         'my-task-002'
     """
-    logger.debug(f"Creating task configuration for task ID: '{task_id}'")
-    logger.debug(f"Base command line: '{base_call}'")
+    logger.debug("Creating task configuration for task ID: '%s'", task_id)
+    logger.debug("Base command line: '%s'", base_call)
 
     if container_settings:
         logger.debug(
-            f"Container settings provided: image='{container_settings.image_name}'"
+            "Container settings provided: image='%s'", container_settings.image_name
         )
         if hasattr(container_settings, "registry") and container_settings.registry:
             logger.debug(
-                f"Using private registry: {container_settings.registry.registry_server}"
+                "Using private registry: %s",
+                container_settings.registry.registry_server,
             )
     else:
         logger.debug("No container settings provided, task will run on host")
@@ -391,14 +678,9 @@ def get_task_config(
         logger.debug(
             "No user identity provided, creating automatic admin user identity"
         )
-        user_identity = UserIdentity(
-            auto_user=AutoUserSpecification(
-                scope=AutoUserScope.POOL,
-                elevation_level=ElevationLevel.ADMIN,
-            )
-        )
+        user_identity = _DEFAULT_USER_IDENTITY
         logger.debug(
-            "Created automatic user identity with pool scope and admin elevation"
+            "Using automatic user identity with pool scope and admin elevation"
         )
     else:
         logger.debug("Using provided user identity")
@@ -408,23 +690,31 @@ def get_task_config(
         logger.debug("No output files provided, initializing empty list")
     else:
         logger.debug(
-            f"Output files provided: {len(ensure_listlike(output_files))} files"
+            "Output files provided: %s files",
+            len(output_files) if type(output_files) is list else 1,
         )
 
-    if log_blob_container is not None:
+    if log_output_file_factory is not None:
+        log_output_files = log_output_file_factory(task_id)
+        logger.debug("Created log output file configuration from factory")
+    elif log_blob_container is not None:
         logger.debug(
-            f"Log blob container specified: '{log_blob_container}' in account '{log_blob_account}'"
+            "Log blob container specified: '%s' in account '%s'",
+            log_blob_container,
+            log_blob_account,
         )
         logger.debug(
-            f"Log configuration: subdir='{log_subdir}', pattern='{log_file_pattern}', condition='{log_upload_condition}'"
+            "Log configuration: subdir='%s', pattern='%s', condition='%s'",
+            log_subdir,
+            log_file_pattern,
+            log_upload_condition,
         )
 
-        if log_subdir is None:
-            log_subdir = ""
+        if not log_subdir:
             logger.debug("No log subdirectory specified, using container root")
 
-        log_path = Path(log_subdir, task_id).as_posix()
-        logger.debug(f"Log files will be saved to path: '{log_path}'")
+        log_path = _join_log_path(_log_path_prefix(log_subdir), task_id)
+        logger.debug("Log files will be saved to path: '%s'", log_path)
 
         log_output_files = output_task_files_to_blob(
             file_pattern=log_file_pattern,
@@ -441,26 +731,17 @@ def get_task_config(
             "No log blob container specified, task logs will not be persisted to blob storage"
         )
 
-    total_output_files = ensure_listlike(output_files) + ensure_listlike(
-        log_output_files
-    )
-    logger.debug(
-        f"Total output files configured: {len(total_output_files)} ({len(ensure_listlike(output_files))} custom + {len(ensure_listlike(log_output_files))} log files)"
-    )
+    total_output_files = _coerce_pair(output_files, log_output_files)
+    logger.debug("Total output files configured: %s", len(total_output_files))
 
     # Filter kwargs to only include valid BatchTaskCreateOptions parameters
     # Remove parameters that don't exist in 15.x API but may be passed from callers
-    invalid_params = {"run_dependent_tasks_on_failure", "run_dependent_tasks_on_fail"}
-    valid_kwargs = {k: v for k, v in kwargs.items() if k not in invalid_params}
-
-    if valid_kwargs:
-        logger.debug(
-            f"Additional BatchTaskCreateOptions kwargs: {list(valid_kwargs.keys())}"
-        )
-    if invalid_params & set(kwargs.keys()):
-        logger.debug(
-            f"Filtering out unsupported parameters: {invalid_params & set(kwargs.keys())}"
-        )
+    if kwargs:
+        dropped_params = _UNSUPPORTED_TASK_PARAMS.intersection(kwargs)
+        if dropped_params:
+            logger.debug("Filtering out unsupported parameters: %s", dropped_params)
+            kwargs = {k: v for k, v in kwargs.items() if k not in dropped_params}
+        logger.debug("Additional BatchTaskCreateOptions kwargs: %s", list(kwargs))
 
     task_config = BatchTaskCreateOptions(
         id=task_id,
@@ -468,16 +749,292 @@ def get_task_config(
         container_settings=container_settings,
         user_identity=user_identity,
         output_files=total_output_files,
-        **valid_kwargs,
+        **kwargs,
     )
 
     logger.debug(
-        f"Successfully created BatchTaskCreateOptions for task '{task_id}' with {len(total_output_files)} output files"
+        "Successfully created BatchTaskCreateOptions for task '%s' with %s output files",
+        task_id,
+        len(total_output_files),
     )
 
     return task_config
 
 
+@dataclass(slots=True, frozen=True)
+class TaskSpec:
+    """Compact description of a task, converted to a BatchTaskCreateOptions on demand.
+
+    Holding many tasks as TaskSpec objects and converting them chunk by chunk
+    with get_task_configs_bulk keeps only one chunk of the larger SDK objects
+    in memory at a time.
+
+    Example:
+        >>> specs = [
+        ...     TaskSpec(
+        ...         task_id=f"task-{i}",
+        ...         base_call=f"python run.py {i}",
+        ...         container_image_name="myregistry.azurecr.io/myapp:latest",
+        ...         mount_pairs=(("data", "/app/data"),),
+        ...     )
+        ...     for i in range(1000)
+        ... ]
+        >>> for chunk in get_task_configs_bulk(specs):
+        ...     batch_client.create_task_collection(
+        ...         "my-job", BatchTaskGroup(task_values=chunk)
+        ...     )
+    """
+
+    task_id: str
+    base_call: str
+    container_image_name: str = None
+    mount_pairs: tuple[tuple[str, str], ...] = ()
+    additional_options: str = ""
+    log_output_file_factory: Callable[[str], OutputFile] = None
+
+    def to_task_create_options(self, **kwargs) -> BatchTaskCreateOptions:
+        """Build the BatchTaskCreateOptions for this task.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to get_task_config.
+
+        Returns:
+            BatchTaskCreateOptions: The task configuration object.
+        """
+        container_settings = None
+        if self.container_image_name is not None:
+            container_settings = get_container_settings(
+                self.container_image_name,
+                mount_pairs=[
+                    MountPair(source, target) for source, target in self.mount_pairs
+                ],
+                additional_options=self.additional_options,
+            )
+        return get_task_config(
+            task_id=self.task_id,
+            base_call=self.base_call,
+            container_settings=container_settings,
+            log_output_file_factory=self.log_output_file_factory,
+            **kwargs,
+        )
+
+
+def _build_task_create_options(spec: TaskSpec | dict) -> BatchTaskCreateOptions:
+    """Build a single BatchTaskCreateOptions from a task spec.
+
+    Args:
+        spec: TaskSpec, or dictionary of keyword arguments accepted by
+            get_task_config. A dictionary must include ``task_id`` and ``base_call``.
+
+    Returns:
+        BatchTaskCreateOptions: The task configuration object.
+    """
+    if isinstance(spec, TaskSpec):
+        return spec.to_task_create_options()
+    return get_task_config(**spec)
+
+
+def get_task_configs_bulk(
+    specs: Iterable[TaskSpec | dict], chunk_size: int = 100
+) -> Iterator[list[BatchTaskCreateOptions]]:
+    """Build task configurations in chunks ready for a task collection request.
+
+    Each spec is converted with get_task_config, and the results are grouped
+    into lists of at most ``chunk_size`` tasks, which is the Azure Batch limit
+    for a single task collection request. Specs are consumed lazily, so only
+    one chunk of task objects is held in memory at a time.
+    Requires azure-batch>=15.0.0.
+
+    Args:
+        specs: Iterable of TaskSpec objects or dictionaries of keyword arguments
+            accepted by get_task_config. Each dictionary must include ``task_id``
+            and ``base_call``.
+        chunk_size: Maximum number of tasks per chunk. Must be between 1 and
+            100. Defaults to 100.
+
+    Returns:
+        Iterator[list[BatchTaskCreateOptions]]: Iterator over lists of task
+            configuration objects.
+
+    Raises:
+        ValueError: If ``chunk_size`` is not between 1 and 100.
+
+    Example:
+        >>> from azure.batch.models import BatchTaskGroup
+        >>> specs = [
+        ...     {"task_id": f"task-{i}", "base_call": f"python run.py {i}"}
+        ...     for i in range(250)
+        ... ]
+        >>> for chunk in get_task_configs_bulk(specs):
+        ...     result = batch_client.create_task_collection(
+        ...         "my-job", BatchTaskGroup(task_values=chunk)
+        ...     )
+
+        Tasks that fail in a chunk are reported in the ``result_values`` of
+        the returned BatchCreateTaskCollectionResult and can be resubmitted in
+        a new chunk.
+    """
+    if not 1 <= chunk_size <= 100:
+        raise ValueError(f"chunk_size must be between 1 and 100. Got {chunk_size}.")
+    logger.debug("Building task configurations in chunks of %s", chunk_size)
+
+    configs = map(_build_task_create_options, specs)
+    return iter(lambda: list(islice(configs, chunk_size)), [])
+
+
+def build_tasks_parallel(
+    specs: Iterable[TaskSpec | dict], max_workers: int = 8
+) -> list[BatchTaskCreateOptions]:
+    """Build task configurations from many specs using a pool of threads.
+
+    Each spec is converted with get_task_config. Results are returned in the
+    same order as ``specs``, and can be grouped for submission in the same way
+    as get_task_configs_bulk does. Tune ``max_workers`` to the cores available
+    on the submitting machine. The default compute node identity reference and
+    log container endpoints are looked up once and shared across threads.
+    Requires azure-batch>=15.0.0.
+
+    Args:
+        specs: Iterable of TaskSpec objects or dictionaries of keyword arguments
+            accepted by get_task_config. Each dictionary must include ``task_id``
+            and ``base_call``.
+        max_workers: Maximum number of threads to use. Defaults to 8.
+
+    Returns:
+        list[BatchTaskCreateOptions]: Task configuration objects, in the order
+            of ``specs``.
+
+    Example:
+        >>> specs = [
+        ...     {"task_id": f"task-{i}", "base_call": f"python run.py {i}"}
+        ...     for i in range(1000)
+        ... ]
+        >>> tasks = build_tasks_parallel(specs, max_workers=4)
+        >>> print(len(tasks))
+        1000
+    """
+    logger.debug("Building task configurations with up to %s threads", max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        tasks = list(executor.map(_build_task_create_options, specs))
+    logger.debug("Built %s task configurations", len(tasks))
+    return tasks
+
+
+def submit_task_collection(
+    batch_client,
+    job_id: str,
+    specs: Iterable[TaskSpec | dict],
+) -> list[BatchCreateTaskCollectionResult | Exception]:
+    """Add tasks to a job with task collection requests of up to 100 tasks each.
+
+    Tasks are built in chunks with get_task_configs_bulk, and each chunk is added
+    with a single ``create_tasks`` call on the BatchClient, instead of one request
+    per task. ``create_tasks`` resubmits tasks that fail with retryable errors.
+    A chunk that raises does not stop later chunks from being submitted; its
+    exception is returned in place of its result.
+    Requires azure-batch>=15.0.0.
+
+    Args:
+        batch_client: An ``azure.batch.BatchClient``.
+        job_id: ID of the job to which to add the tasks.
+        specs: Iterable of TaskSpec objects or dictionaries of keyword arguments
+            accepted by get_task_config.
+
+    Returns:
+        list[BatchCreateTaskCollectionResult | Exception]: One entry per chunk, in
+            chunk order. Each entry is the chunk's result, or the exception raised
+            while adding it (usually a ``CreateTasksError``, whose
+            ``pending_tasks`` and ``failure_tasks`` list the tasks not added).
+
+    Example:
+        >>> specs = [
+        ...     {"task_id": f"task-{i}", "base_call": f"python run.py {i}"}
+        ...     for i in range(1000)
+        ... ]
+        >>> results = submit_task_collection(batch_client, "my-job", specs)
+        >>> print(len(results))
+        10
+    """
+    results = []
+    for chunk in get_task_configs_bulk(specs):
+        try:
+            results.append(batch_client.create_tasks(job_id, chunk))
+            logger.debug("Submitted chunk of %s tasks to job '%s'", len(chunk), job_id)
+        except Exception as e:
+            logger.warning(
+                f"Failed to add chunk {len(results)} of {len(chunk)} tasks to job '{job_id}': {e}"
+            )
+            results.append(e)
+    logger.info(f"Submitted {len(results)} task collection(s) to job '{job_id}'.")
+    return results
+
+
+async def submit_tasks_async(
+    batch_client,
+    job_id: str,
+    specs: Iterable[TaskSpec | dict],
+    max_concurrent_requests: int = 4,
+) -> list[BatchCreateTaskCollectionResult | Exception]:
+    """Add tasks to a job with several task collection requests in flight at once.
+
+    Tasks are built in chunks of 100 with get_task_configs_bulk, and each chunk
+    is added with ``create_tasks`` on an async BatchClient, which resubmits tasks
+    that fail with retryable errors. At most ``max_concurrent_requests`` chunks
+    are in flight at a time, and the next chunk is only built once a slot is
+    free. Keep the limit modest to stay within Batch service throttling limits.
+    A chunk that raises does not cancel the others; its exception is returned
+    in place of its result.
+    Requires azure-batch>=15.0.0.
+
+    Args:
+        batch_client: An ``azure.batch.aio.BatchClient``.
+        job_id: ID of the job to which to add the tasks.
+        specs: Iterable of TaskSpec objects or dictionaries of keyword arguments
+            accepted by get_task_config.
+        max_concurrent_requests: Maximum number of chunks to submit at the same
+            time. Defaults to 4.
+
+    Returns:
+        list[BatchCreateTaskCollectionResult | Exception]: One entry per chunk, in
+            chunk order. Each entry is the chunk's result, or the exception raised
+            while adding it (usually a ``CreateTasksError``, whose
+            ``pending_tasks`` and ``failure_tasks`` list the tasks not added).
+
+    Example:
+        >>> from azure.batch.aio import BatchClient
+        >>> async with BatchClient(endpoint, credential) as batch_client:
+        ...     results = await submit_tasks_async(batch_client, "my-job", specs)
+    """
+    logger.debug(
+        "Submitting tasks to job '%s' with up to %s concurrent requests",
+        job_id,
+        max_concurrent_requests,
+    )
+    semaphore = anyio.Semaphore(max_concurrent_requests)
+    results = []
+
+    async def submit_chunk(index: int, chunk: list[BatchTaskCreateOptions]) -> None:
+        try:
+            results[index] = await batch_client.create_tasks(job_id, chunk)
+            logger.debug("Submitted chunk of %s tasks to job '%s'", len(chunk), job_id)
+        except Exception as e:
+            logger.warning(
+                f"Failed to add chunk {index} of {len(chunk)} tasks to job '{job_id}': {e}"
+            )
+            results[index] = e
+        finally:
+            semaphore.release()
+
+    async with anyio.create_task_group() as tg:
+        for chunk in get_task_configs_bulk(specs):
+            await semaphore.acquire()
+            results.append(None)
+            tg.start_soon(submit_chunk, len(results) - 1, chunk)
+
+    logger.info(f"Submitted {len(results)} task collection(s) to job '{job_id}'.")
+    return results
+
+
 def get_batch_compute_id(
     compute_id: batch_mgmt_models.ComputeNodeIdentityReference,
 ) -> BatchNodeIdentityReference:
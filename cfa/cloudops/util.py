@@ -2,14 +2,27 @@
 Miscellaneous utilities for interacting with Azure.
 """
 
+import copy
 import datetime
 import getpass
 import json
 import logging
+import shutil
 import subprocess as sp
+import threading
+import time
 from collections.abc import MutableSequence
+from functools import lru_cache
+from operator import attrgetter
 from zoneinfo import ZoneInfo
 
+from azure.core import PipelineClient
+from azure.core.pipeline.policies import (
+    BearerTokenCredentialPolicy,
+    HeadersPolicy,
+    RetryPolicy,
+)
+from azure.core.rest import HttpRequest
 from azure.identity import DefaultAzureCredential
 from azure.mgmt.batch import BatchManagementClient
 from azure.mgmt.batch.models import SupportedSku
@@ -20,19 +33,150 @@ from .config import get_config_val
 logger = logging.getLogger(__name__)
 
 
-def lookup_service_principal(display_name: str) -> list:
+_GRAPH_ENDPOINT = "https://graph.microsoft.com/v1.0"
+_GRAPH_SCOPE = "https://graph.microsoft.com/.default"
+
+
+@lru_cache(maxsize=1)
+def _get_graph_pipeline_client() -> PipelineClient:
+    """Get a module-wide Microsoft Graph pipeline client.
+
+    The client, its credential and its underlying HTTP session are created once
+    and reused, so repeated lookups share a cached token and keep-alive connection.
+    """
+    credential = DefaultAzureCredential()
+    return PipelineClient(
+        base_url=_GRAPH_ENDPOINT,
+        policies=[
+            HeadersPolicy(),
+            RetryPolicy(),
+            BearerTokenCredentialPolicy(credential, _GRAPH_SCOPE),
+        ],
+    )
+
+
+# Graph accepts at most 15 values in a single `in` filter expression
+_GRAPH_MAX_IN_VALUES = 15
+
+
+def _odata_string(value: str) -> str:
+    """Quote a value as an OData string literal, doubling any single quotes."""
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
+
+
+def _graph_query_service_principals(odata_filter: str) -> list:
+    """Query Microsoft Graph for service principals matching an OData filter.
+
+    Args:
+        odata_filter: The ``$filter`` expression to apply.
+
+    Returns:
+        list: The matching service principals as dictionaries, across all pages.
+
+    Raises:
+        azure.core.exceptions.HttpResponseError: If Graph returns an error status.
+    """
+    client = _get_graph_pipeline_client()
+    request = HttpRequest(
+        "GET",
+        f"{_GRAPH_ENDPOINT}/servicePrincipals",
+        params={"$filter": odata_filter},
+    )
+    results = []
+    while request is not None:
+        response = client.send_request(request)
+        response.raise_for_status()
+        body = response.json()
+        results.extend(body.get("value", []))
+        next_link = body.get("@odata.nextLink")
+        request = HttpRequest("GET", next_link) if next_link else None
+    return results
+
+
+def _graph_list_service_principals(display_name: str) -> list:
+    """Query Microsoft Graph for service principals with a given display name.
+
+    Args:
+        display_name: The display name of the service principal to look up.
+
+    Returns:
+        list: The matching service principals as dictionaries.
+
+    Raises:
+        azure.core.exceptions.HttpResponseError: If Graph returns an error status.
+    """
+    return _graph_query_service_principals(
+        f"displayName eq {_odata_string(display_name)}"
+    )
+
+
+def _graph_list_service_principals_for_names(display_names: list[str]) -> list:
+    """Query Microsoft Graph for service principals matching any of several display names.
+
+    Sends one request per group of up to 15 names.
+
+    Args:
+        display_names: The display names to look up.
+
+    Returns:
+        list: The matching service principals as dictionaries.
+
+    Raises:
+        azure.core.exceptions.HttpResponseError: If Graph returns an error status.
+    """
+    results = []
+    for start in range(0, len(display_names), _GRAPH_MAX_IN_VALUES):
+        chunk = display_names[start : start + _GRAPH_MAX_IN_VALUES]
+        values = ", ".join(_odata_string(name) for name in chunk)
+        results.extend(_graph_query_service_principals(f"displayName in ({values})"))
+    return results
+
+
+@lru_cache(maxsize=1)
+def _resolve_az_executable() -> str:
+    """Find the Azure CLI executable once, including ``az.cmd`` on Windows.
+
+    Falls back to "az", so a missing CLI surfaces as an error when it is run.
+    """
+    return shutil.which("az") or "az"
+
+
+_AZ_CLI_TIMEOUT_SECONDS = 60
+_SERVICE_PRINCIPAL_CACHE_TTL = 300.0
+_service_principal_cache: dict[str, tuple[float, list]] = {}
+_service_principal_cache_lock = threading.Lock()
+
+
+def clear_service_principal_cache() -> None:
+    """Clear cached results of lookup_service_principal.
+
+    Example:
+        >>> clear_service_principal_cache()
+    """
+    with _service_principal_cache_lock:
+        _service_principal_cache.clear()
+
+
+def lookup_service_principal(display_name: str, use_cache: bool = True) -> list:
     """Look up an Azure service principal from its display name.
 
-    Requires the Azure CLI.
+    Queries Microsoft Graph directly using ``DefaultAzureCredential``. If the
+    Graph query fails (e.g. no credential is available), falls back to the
+    Azure CLI (``az ad sp list``).
 
     Args:
         display_name: The display name of the service principal to look up.
+        use_cache: If True (the default), reuse a result for the same display
+            name looked up within the last five minutes. Pass False to always
+            query. See also ``clear_service_principal_cache``.
 
     Returns:
         list: The results, if any, or an empty list if no match was found.
 
     Raises:
-        RuntimeError: If the Azure CLI command fails or is not available.
+        RuntimeError: If the Graph query fails and the Azure CLI command fails
+            or is not available.
 
     Example:
         >>> # Look up a service principal by display name
@@ -47,17 +191,145 @@ def lookup_service_principal(display_name: str) -> list:
         f"Looking up Azure service principal with display name: '{display_name}'"
     )
 
+    if use_cache:
+        with _service_principal_cache_lock:
+            cached = _service_principal_cache.get(display_name)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < _SERVICE_PRINCIPAL_CACHE_TTL
+        ):
+            logger.debug("Using cached service principal lookup result")
+            # Copy so callers cannot modify the cached entry
+            return copy.deepcopy(cached[1])
+
+    parsed = _query_service_principals(display_name)
+
+    if use_cache:
+        with _service_principal_cache_lock:
+            _service_principal_cache[display_name] = (
+                time.monotonic(),
+                copy.deepcopy(parsed),
+            )
+
+    return parsed
+
+
+def lookup_service_principals(
+    display_names: list[str], use_cache: bool = True
+) -> dict[str, list]:
+    """Look up several Azure service principals from their display names at once.
+
+    Queries Microsoft Graph for all uncached names together, in groups of up
+    to 15 names per request. If the Graph query fails, each name is looked up
+    separately as in ``lookup_service_principal``, including the Azure CLI
+    fallback.
+
+    Args:
+        display_names: The display names of the service principals to look up.
+        use_cache: If True (the default), reuse and store results in the same
+            cache as ``lookup_service_principal``.
+
+    Returns:
+        dict[str, list]: For each requested display name, the matching service
+            principals, or an empty list if no match was found.
+
+    Raises:
+        RuntimeError: If the Graph query fails and the Azure CLI command fails
+            or is not available.
+
+    Example:
+        >>> found = lookup_service_principals(["sp-one", "sp-two"])
+        >>> for name, matches in found.items():
+        ...     print(name, [sp["appId"] for sp in matches])
+    """
+    names = list(dict.fromkeys(display_names))
+    logger.debug(f"Looking up {len(names)} Azure service principal(s) by display name")
+
+    results = {}
+    if use_cache:
+        now = time.monotonic()
+        with _service_principal_cache_lock:
+            for name in names:
+                cached = _service_principal_cache.get(name)
+                if (
+                    cached is not None
+                    and now - cached[0] < _SERVICE_PRINCIPAL_CACHE_TTL
+                ):
+                    results[name] = copy.deepcopy(cached[1])
+        logger.debug(f"Found {len(results)} service principal lookup(s) in cache")
+
+    missing = [name for name in names if name not in results]
+    if missing:
+        try:
+            matches = _graph_list_service_principals_for_names(missing)
+            fetched = {name: [] for name in missing}
+            # Graph matches display names case-insensitively, so bucket the same way
+            requested = {}
+            for name in missing:
+                requested.setdefault(name.casefold(), []).append(name)
+            for principal in matches:
+                key = (principal.get("displayName") or "").casefold()
+                for name in requested.get(key, ()):
+                    fetched[name].append(principal)
+        except Exception as e:
+            logger.debug(
+                f"Microsoft Graph batch query failed, looking up names individually: {str(e)}"
+            )
+            fetched = {name: _query_service_principals(name) for name in missing}
+
+        if use_cache:
+            now = time.monotonic()
+            with _service_principal_cache_lock:
+                for name, found in fetched.items():
+                    _service_principal_cache[name] = (now, copy.deepcopy(found))
+        results.update(fetched)
+
+    return {name: results[name] for name in names}
+
+
+def _query_service_principals(display_name: str) -> list:
+    """Query service principals by display name via Graph, falling back to the Azure CLI."""
     try:
-        command = [f"az ad sp list --display-name {display_name}"]
-        logger.debug(f"Executing Azure CLI command: {command[0]}")
+        parsed = _graph_list_service_principals(display_name)
+        logger.debug(
+            f"Microsoft Graph query succeeded, found {len(parsed)} service principal(s)"
+        )
+        return parsed
+    except Exception as e:
+        logger.debug(
+            f"Microsoft Graph query failed, falling back to Azure CLI: {str(e)}"
+        )
 
+    try:
+        command = [
+            _resolve_az_executable(),
+            "ad",
+            "sp",
+            "list",
+            "--display-name",
+            display_name,
+            "--output",
+            "json",
+        ]
+        logger.debug(f"Executing Azure CLI command: {' '.join(command)}")
+
+        # json.loads accepts the raw bytes, so skip decoding to str first.
+        # No stdin, so an interactive login prompt fails instead of waiting.
         result = sp.check_output(
-            command, shell=True, universal_newlines=True, text=True
+            command, stdin=sp.DEVNULL, timeout=_AZ_CLI_TIMEOUT_SECONDS
         )
         logger.debug(
-            f"Azure CLI command executed successfully, result length: {len(result)} characters"
+            f"Azure CLI command executed successfully, result length: {len(result)} bytes"
         )
-
+    except sp.TimeoutExpired as e:
+        error_msg = (
+            f"`az ad sp list` did not finish within {_AZ_CLI_TIMEOUT_SECONDS} "
+            "seconds. It may be waiting for interactive authentication; "
+            "run `az login` (e.g. with `--use-device-code`) first, or "
+            "configure non-interactive credentials."
+        )
+        logger.debug(f"Azure CLI command timed out: {str(e)}")
+        raise RuntimeError(error_msg) from e
     except Exception as e:
         error_msg = (
             "Attempt to search available Azure "
@@ -89,6 +361,7 @@ def ensure_listlike(x: any) -> MutableSequence:
     """Ensure that an object either behaves like a MutableSequence or return a one-item list.
 
     If the object is not a MutableSequence, return a one-item list containing the object.
+    Tuples are the exception: their items are copied into a new list.
     Useful for handling list-of-strings inputs alongside single strings.
 
     Based on this `StackOverflow approach <https://stackoverflow.com/a/66485952>`_.
@@ -97,8 +370,9 @@ def ensure_listlike(x: any) -> MutableSequence:
         x: The item to ensure is list-like.
 
     Returns:
-        MutableSequence: ``x`` if ``x`` is a MutableSequence, otherwise ``[x]``
-            (i.e. a one-item list containing ``x``).
+        MutableSequence: ``x`` if ``x`` is a MutableSequence, a list of its items
+            if ``x`` is a tuple, otherwise ``[x]`` (i.e. a one-item list
+            containing ``x``).
 
     Example:
         >>> # Single string becomes a list
@@ -116,19 +390,41 @@ def ensure_listlike(x: any) -> MutableSequence:
         >>> print(result)
         [42]
     """
-    logger.debug(f"Ensuring input is list-like: type={type(x)}, value={repr(x)}")
+    # Concrete type checks first: they skip the slower ABC instance check
+    x_type = type(x)
+    if x_type is list:
+        return x
+    if x_type is tuple:
+        return list(x)
+    return x if isinstance(x, MutableSequence) else [x]
 
-    is_mutable_sequence = isinstance(x, MutableSequence)
-    logger.debug(f"Input is MutableSequence: {is_mutable_sequence}")
 
-    if is_mutable_sequence:
-        logger.debug(f"Returning original MutableSequence with {len(x)} items")
-        return x
+def _coerce_pair(a: any, b: any) -> list:
+    """Concatenate two items into a single new list, as ensure_listlike would see them.
+
+    Equivalent to ``list(ensure_listlike(a)) + list(ensure_listlike(b))``, but
+    builds only one list.
+
+    Args:
+        a: First item, or tuple or MutableSequence of items.
+        b: Second item, or tuple or MutableSequence of items.
+
+    Returns:
+        list: The items of ``a`` followed by the items of ``b``.
+    """
+    # type() checks first: plain lists are the common case and skip the ABC check
+    if type(a) in (list, tuple):
+        result = list(a)
+    else:
+        result = list(a) if isinstance(a, MutableSequence) else [a]
+    if type(b) in (list, tuple) or isinstance(b, MutableSequence):
+        result.extend(b)
     else:
-        logger.debug("Converting single item to list")
-        result = [x]
-        logger.debug(f"Created list with 1 item: {repr(result)}")
-        return result
+        result.append(b)
+    return result
+
+
+_capability_name_value = attrgetter("name", "value")
 
 
 def sku_to_dict(sku: SupportedSku):
@@ -151,40 +447,132 @@ def sku_to_dict(sku: SupportedSku):
         >>> print(sku_dict['family_name'])  # e.g., 'standardDSv3Family'
         >>> print(sku_dict.get('vCPUs'))  # e.g., '2' (from capabilities)
     """
-    logger.debug(
-        f"Converting SupportedSku to dictionary: name='{sku.name}', family='{sku.family_name}'"
-    )
-    logger.debug(f"SKU batch support end of life: {sku.batch_support_end_of_life}")
+    # Called once per SKU in a listing, so this deliberately does not log
+    result_dict = {
+        "name": sku.name,
+        "family_name": sku.family_name,
+        "batch_support_end_of_life": sku.batch_support_end_of_life,
+        "additional_properties": getattr(sku, "additional_properties", None),
+    }
+
+    # Populate capabilities directly rather than merging a second dict
+    capabilities = getattr(sku, "capabilities", None)
+    if capabilities:
+        result_dict.update(map(_capability_name_value, capabilities))
 
-    if hasattr(sku, "capabilities") and sku.capabilities:
-        capabilities_count = len(sku.capabilities)
-        logger.debug(f"Processing {capabilities_count} SKU capabilities")
-        capabilities_dict = {c.name: c.value for c in sku.capabilities}
-        logger.debug(f"SKU capabilities: {list(capabilities_dict.keys())}")
-    else:
-        logger.debug("No SKU capabilities found")
-        capabilities_dict = {}
+    return result_dict
 
-    if hasattr(sku, "additional_properties") and sku.additional_properties:
-        logger.debug(
-            f"Additional properties present: {list(sku.additional_properties.keys())}"
-        )
-    else:
-        logger.debug("No additional properties found")
-
-    result_dict = dict(
-        name=sku.name,
-        family_name=sku.family_name,
-        batch_support_end_of_life=sku.batch_support_end_of_life,
-        additional_properties=sku.additional_properties,
-        **capabilities_dict,
+
+def _sku_location_and_subscription(
+    config_dict: dict | None, try_env: bool
+) -> tuple[str, str | None]:
+    """Look up the configured batch location and, if set, the subscription ID."""
+    batch_location = get_config_val(
+        "azure_batch_location",
+        config_dict=config_dict,
+        try_env=try_env,
     )
+    try:
+        subscription_id = get_config_val(
+            "azure_subscription_id",
+            config_dict=config_dict,
+            try_env=try_env,
+        )
+    except ValueError:
+        subscription_id = None
+    return batch_location, subscription_id
 
-    logger.debug(
-        f"Successfully converted SKU to dictionary with {len(result_dict)} keys"
+
+def _sku_client_and_config(
+    config_dict: dict | None, try_env: bool
+) -> tuple[BatchManagementClient, str, str | None]:
+    """Create a BatchManagementClient and look up the batch location and subscription."""
+    from .client import get_batch_management_client
+
+    client = get_batch_management_client(config_dict=config_dict, try_env=try_env)
+    logger.debug("Successfully created BatchManagementClient")
+    return client, *_sku_location_and_subscription(config_dict, try_env)
+
+
+@lru_cache(maxsize=8)
+def _cached_sku_client_and_config(
+    config_items: tuple, try_env: bool
+) -> tuple[BatchManagementClient, str, str | None]:
+    """Cached _sku_client_and_config, keyed on the sorted config_dict items."""
+    return _sku_client_and_config(dict(config_items) or None, try_env)
+
+
+_SKU_CACHE_TTL = 900.0
+_SKU_CACHE_MAX_ENTRIES = 32
+_sku_cache: dict[tuple, tuple[float, list]] = {}
+_sku_cache_lock = threading.Lock()
+
+
+def _list_supported_skus(
+    client: BatchManagementClient,
+    batch_location: str,
+    subscription_id: str | None,
+    use_cache: bool,
+    kwargs: dict,
+) -> list[SupportedSku]:
+    """List the SupportedSku objects for a location, reusing recent results.
+
+    Results are cached per subscription, location and keyword arguments, and
+    are not cached when no subscription ID is configured. Expired entries are
+    dropped whenever a new listing is stored, and the oldest entry is evicted
+    once the cache holds ``_SKU_CACHE_MAX_ENTRIES`` listings.
+    """
+    key = None
+    if use_cache and subscription_id is None:
+        logger.debug("No Azure subscription ID configured, skipping SKU cache")
+    elif use_cache:
+        try:
+            key = (subscription_id, batch_location, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            logger.debug("SKU lookup arguments are unhashable, skipping cache")
+            key = None
+
+    if key is not None:
+        with _sku_cache_lock:
+            cached = _sku_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _SKU_CACHE_TTL:
+            logger.debug(f"Using {len(cached[1])} cached VM SKUs")
+            return cached[1]
+
+    logger.debug("Calling Azure API to list supported virtual machine SKUs")
+    skus = list(
+        client.location.list_supported_virtual_machine_skus(
+            location_name=batch_location,
+            **kwargs,
+        )
     )
+    logger.debug(f"Successfully retrieved {len(skus)} VM SKUs from Azure API")
+
+    if key is not None:
+        now = time.monotonic()
+        with _sku_cache_lock:
+            for stale in [
+                k for k, (t, _) in _sku_cache.items() if now - t >= _SKU_CACHE_TTL
+            ]:
+                del _sku_cache[stale]
+            _sku_cache.pop(key, None)
+            while len(_sku_cache) >= _SKU_CACHE_MAX_ENTRIES:
+                # Dicts keep insertion order, so the first key is the oldest
+                del _sku_cache[next(iter(_sku_cache))]
+            _sku_cache[key] = (now, skus)
+    return skus
+
+
+def clear_sku_cache() -> None:
+    """Clear the cached client, location and SKU listings used by lookup_available_vm_skus_for_batch.
 
-    return result_dict
+    Example:
+        >>> clear_sku_cache()
+    """
+    _cached_sku_client_and_config.cache_clear()
+    with _sku_cache_lock:
+        _sku_cache.clear()
 
 
 def lookup_available_vm_skus_for_batch(
@@ -192,6 +580,7 @@ def lookup_available_vm_skus_for_batch(
     config_dict: dict = None,
     try_env: bool = True,
     to_dict: bool = True,
+    use_cache: bool = True,
     **kwargs,
 ):
     """Look up available VM image SKUs for the given batch service.
@@ -199,6 +588,9 @@ def lookup_available_vm_skus_for_batch(
     Args:
         client: BatchManagementClient to use when looking up the available images.
             If None, use the output of ``get_batch_management_client()``. Defaults to None.
+            The created client, the configured batch location and subscription ID
+            are cached per ``config_dict``/``try_env`` combination; see
+            ``clear_sku_cache``.
         config_dict: Configuration dictionary. Passed as the ``config_dict`` argument
             to any internal ``config.get_config_val`` calls. See that function's
             documentation for additional details.
@@ -208,6 +600,12 @@ def lookup_available_vm_skus_for_batch(
             additional details.
         to_dict: Apply ``sku_to_dict`` to the list of results? Defaults to True.
             If False, the result will be a list of SupportedSku objects.
+        use_cache: If True (the default), reuse the SKU listing fetched for the same
+            configured ``azure_subscription_id``, location and keyword arguments
+            within the last 15 minutes. Listings are not cached when no
+            subscription ID is configured. With ``to_dict=False``, the cached
+            SupportedSku objects are shared between calls. See also
+            ``clear_sku_cache``.
         **kwargs: Additional keyword arguments passed to
             ``BatchManagementClient.location.list_supported_virtual_machine_skus``.
 
@@ -237,46 +635,39 @@ def lookup_available_vm_skus_for_batch(
         logger.debug(f"Additional kwargs provided: {list(kwargs.keys())}")
 
     if client is None:
-        logger.debug("No client provided, creating BatchManagementClient")
-        from .client import get_batch_management_client
-
-        client = get_batch_management_client(config_dict=config_dict, try_env=try_env)
-        logger.debug("Successfully created BatchManagementClient")
+        logger.debug("No client provided, using cached BatchManagementClient")
+        try:
+            config_items = tuple(sorted((config_dict or {}).items()))
+            client, batch_location, subscription_id = _cached_sku_client_and_config(
+                config_items, try_env
+            )
+        except TypeError:
+            # Unorderable or unhashable config values cannot form a cache key
+            client, batch_location, subscription_id = _sku_client_and_config(
+                config_dict, try_env
+            )
     else:
         logger.debug("Using provided BatchManagementClient")
+        batch_location, subscription_id = _sku_location_and_subscription(
+            config_dict, try_env
+        )
 
-    batch_location = get_config_val(
-        "azure_batch_location",
-        config_dict=config_dict,
-        try_env=try_env,
-    )
     logger.debug(f"Using Azure Batch location: '{batch_location}'")
 
-    logger.debug("Calling Azure API to list supported virtual machine SKUs")
     try:
-        sku_iterator = client.location.list_supported_virtual_machine_skus(
-            location_name=batch_location,
-            **kwargs,
+        raw_skus = _list_supported_skus(
+            client, batch_location, subscription_id, use_cache, kwargs
         )
-        result = [item for item in sku_iterator]
-        logger.debug(f"Successfully retrieved {len(result)} VM SKUs from Azure API")
-
     except Exception as e:
         logger.debug(f"Failed to retrieve VM SKUs from Azure API: {str(e)}")
         raise
 
-    if result:
-        sample_sku_names = [sku.name for sku in result[:3]]
-        logger.debug(f"Sample SKU names: {sample_sku_names}")
-    else:
-        logger.debug("No VM SKUs returned from Azure API")
-
     if to_dict:
         logger.debug("Converting SupportedSku objects to dictionaries")
-        result = [sku_to_dict(x) for x in result]
-        logger.debug(f"Successfully converted {len(result)} SKUs to dictionaries")
+        result = [sku_to_dict(item) for item in raw_skus]
     else:
         logger.debug("Returning raw SupportedSku objects")
+        result = list(raw_skus)
 
     logger.debug(
         f"Returning {len(result)} VM SKUs (as {'dictionaries' if to_dict else 'SupportedSku objects'})"
@@ -2,11 +2,17 @@ import os
 
 import pandas as pd
 
-df = pd.DataFrame(columns=["state", "population", "affected"])
-
-for file in os.listdir("data"):
-    if file.endswith("_affected.csv"):
-        in_df = pd.read_csv(os.path.join("data", file))
-        df = pd.concat([df, in_df], axis=0, ignore_index=True)
+with os.scandir("data") as entries:
+    frames = [
+        pd.read_csv(entry.path, usecols=["affected"])
+        for entry in entries
+        if entry.name.endswith("_affected.csv") and entry.is_file()
+    ]
+# concatenate once rather than growing a DataFrame inside the loop
+df = (
+    pd.concat(frames, axis=0, ignore_index=True)
+    if frames
+    else pd.DataFrame(columns=["affected"])
+)
 
 print(df["affected"].sum())
@@ -1,27 +1,52 @@
 import argparse
+import csv
 import os
 import random
+from functools import cache
 
-import pandas as pd
+
+@cache
+def population_by_state() -> dict[str, int]:
+    # the population table is tiny, so plain csv avoids importing pandas per task
+    with open("us_pop_by_state.csv", newline="") as f:
+        # the unranked last row is the U.S. total, not a state
+        return {
+            row["state_code"]: int(row["2020_census"])
+            for row in csv.DictReader(f)
+            if row["rank"]
+        }
+
+
+def write_affected(state: str, population: int) -> None:
+    affected = int(population * random.uniform(0.01, 0.5))
+    row = {"state": state, "population": population, "affected": affected}
+    print(row)
+    os.makedirs("data", exist_ok=True)
+    with open(f"data/{state}_affected.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(row), lineterminator="\n")
+        writer.writeheader()
+        writer.writerow(row)
 
 
 def main(state: str) -> None:
-    df = pd.read_csv("us_pop_by_state.csv")
-    state_data = df[df["state_code"] == state]
-    if not state_data.empty:
-        population = state_data.iloc[0]["2020_census"]
-        affected = int(population * random.uniform(0.01, 0.5))
-        output = pd.DataFrame(
-            {"state": [state], "population": [population], "affected": [affected]}
-        )
-        print(output)
-        if os.path.exists("data") is False:
-            os.mkdir("data")
-        output.to_csv(f"data/{state}_affected.csv", index=False)
+    population = population_by_state().get(state)
+    if population is not None:
+        write_affected(state, population)
+
+
+def main_all() -> None:
+    # read the population data once and process every state in this process
+    for state, population in population_by_state().items():
+        write_affected(state, population)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Process state population data.")
-    parser.add_argument("-s", "--state", type=str, help="State abbreviation to process")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("-s", "--state", type=str, help="State abbreviation to process")
+    group.add_argument("--all", action="store_true", help="Process all states")
     args = parser.parse_args()
-    main(args.state)
+    if args.all:
+        main_all()
+    else:
+        main(args.state)
@@ -0,0 +1,14 @@
+import pytest
+from shared_fixtures import make_fake_blobs
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Make time.sleep return immediately in every test."""
+    monkeypatch.setattr("time.sleep", lambda *args, **kwargs: None)
+
+
+@pytest.fixture(scope="session")
+def fake_blobs():
+    """Fake BlobProperties listing, built once per test session."""
+    return make_fake_blobs()
@@ -5,15 +5,20 @@ FAKE_BLOB_PROPERTIES = [
     {"name": "my-src-path/my_test_2.txt", "size": 200},
     {"name": "my-src-path/not_my_test_1.csv", "size": 250},
     {"name": "my-src-path/not_my_test_2.json", "size": 50},
-    {"name": "my-src-path/large_file_1.parquet", "size": 1e9},
-    {"name": "my-src-path/large_file_2.parquet", "size": 2e9},
+    {"name": "my-src-path/large_file_1.parquet", "size": 1_000_000_000},
+    {"name": "my-src-path/large_file_2.parquet", "size": 2_000_000_000},
 ]
-FAKE_BLOBS = []
-for fake in FAKE_BLOB_PROPERTIES:
-    fake_blob = BlobProperties()
-    fake_blob.name = fake["name"]
-    fake_blob.size = fake["size"]
-    FAKE_BLOBS.append(fake_blob)
+
+
+def make_fake_blobs() -> list[BlobProperties]:
+    fake_blobs = []
+    for fake in FAKE_BLOB_PROPERTIES:
+        fake_blob = BlobProperties()
+        fake_blob.name = fake["name"]
+        fake_blob.size = fake["size"]
+        fake_blobs.append(fake_blob)
+    return fake_blobs
+
 
 FAKE_COMMANDLINE = [
     "script_name.py",
@@ -34,19 +39,29 @@ class MockLogger:
     def __init__(self, name: str):
         self.name = name
         self.messages = []
+        # Mirrors messages for constant-time assert_logged lookups
+        self._message_set = set()
         self.handlers = []
 
+    def _record(self, level, message):
+        self.messages.append((level, message))
+        try:
+            self._message_set.add((level, message))
+        except TypeError:
+            # unhashable messages are only kept in the ordered list
+            pass
+
     def debug(self, message):
-        self.messages.append(("DEBUG", message))
+        self._record("DEBUG", message)
 
     def info(self, message):
-        self.messages.append(("INFO", message))
+        self._record("INFO", message)
 
     def warning(self, message):
-        self.messages.append(("WARNING", message))
+        self._record("WARNING", message)
 
     def error(self, message):
-        self.messages.append(("ERROR", message))
+        self._record("ERROR", message)
 
     def addHandler(self, handler):
         if handler not in self.handlers:
@@ -57,6 +72,10 @@ class MockLogger:
             self.handlers.remove(handler)
 
     def assert_logged(self, level, message):
-        assert (level, message) in self.messages, (
+        try:
+            found = (level, message) in self._message_set
+        except TypeError:
+            found = False
+        assert found or (level, message) in self.messages, (
             f"Expected log ({level}, {message}) not found."
         )
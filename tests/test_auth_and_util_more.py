@@ -6,9 +6,25 @@ import pytest
 from cfa.cloudops import auth, util
 
 
+@pytest.fixture(autouse=True)
+def clear_util_caches():
+    util.clear_service_principal_cache()
+    util.clear_sku_cache()
+    yield
+    util.clear_service_principal_cache()
+    util.clear_sku_cache()
+
+
+def _graph_unavailable(*args, **kwargs):
+    raise RuntimeError("no graph credential")
+
+
 def test_lookup_service_principal_success(monkeypatch):
-    payload = '[{"appId": "abc"}]'
+    payload = b'[{"appId": "abc"}]'
 
+    monkeypatch.setattr(
+        "cfa.cloudops.util._graph_list_service_principals", _graph_unavailable
+    )
     monkeypatch.setattr("cfa.cloudops.util.sp.check_output", lambda *a, **k: payload)
 
     result = util.lookup_service_principal("my-sp")
@@ -19,12 +35,181 @@ def test_lookup_service_principal_failure(monkeypatch):
     def boom(*args, **kwargs):
         raise RuntimeError("az failed")
 
+    monkeypatch.setattr(
+        "cfa.cloudops.util._graph_list_service_principals", _graph_unavailable
+    )
     monkeypatch.setattr("cfa.cloudops.util.sp.check_output", boom)
 
     with pytest.raises(RuntimeError):
         util.lookup_service_principal("my-sp")
 
 
+def test_lookup_service_principal_cli_argv(monkeypatch):
+    seen = {}
+
+    def fake_check_output(command, **kwargs):
+        seen["command"] = command
+        seen["kwargs"] = kwargs
+        return b"[]"
+
+    monkeypatch.setattr(
+        "cfa.cloudops.util._graph_list_service_principals", _graph_unavailable
+    )
+    monkeypatch.setattr(
+        "cfa.cloudops.util._resolve_az_executable", lambda: "/usr/bin/az"
+    )
+    monkeypatch.setattr("cfa.cloudops.util.sp.check_output", fake_check_output)
+
+    assert util.lookup_service_principal("my sp; rm -rf /") == []
+    assert seen["command"][0] == "/usr/bin/az"
+    assert "my sp; rm -rf /" in seen["command"]
+    assert seen["command"][-2:] == ["--output", "json"]
+    assert not seen["kwargs"].get("shell")
+
+
+def test_lookup_service_principal_cli_timeout(monkeypatch):
+    def hang(command, **kwargs):
+        assert kwargs["timeout"] == util._AZ_CLI_TIMEOUT_SECONDS
+        raise util.sp.TimeoutExpired(command, kwargs["timeout"])
+
+    monkeypatch.setattr(
+        "cfa.cloudops.util._graph_list_service_principals", _graph_unavailable
+    )
+    monkeypatch.setattr("cfa.cloudops.util.sp.check_output", hang)
+
+    with pytest.raises(RuntimeError, match="did not finish"):
+        util.lookup_service_principal("my-sp")
+
+
+def test_lookup_service_principal_prefers_graph(monkeypatch):
+    def fail_cli(*args, **kwargs):
+        raise AssertionError("CLI should not be called")
+
+    monkeypatch.setattr(
+        "cfa.cloudops.util._graph_list_service_principals",
+        lambda name: [{"appId": "graph", "displayName": name}],
+    )
+    monkeypatch.setattr("cfa.cloudops.util.sp.check_output", fail_cli)
+
+    assert util.lookup_service_principal("my-sp") == [
+        {"appId": "graph", "displayName": "my-sp"}
+    ]
+
+
+def test_lookup_service_principal_caches_results(monkeypatch):
+    calls = []
+
+    def fake_graph(name):
+        calls.append(name)
+        return [{"appId": "graph"}]
+
+    monkeypatch.setattr("cfa.cloudops.util._graph_list_service_principals", fake_graph)
+
+    first = util.lookup_service_principal("my-sp")
+    first[0]["appId"] = "changed"
+    assert util.lookup_service_principal("my-sp") == [{"appId": "graph"}]
+    assert calls == ["my-sp"]
+
+    util.lookup_service_principal("my-sp", use_cache=False)
+    assert calls == ["my-sp", "my-sp"]
+
+    monkeypatch.setattr("cfa.cloudops.util._SERVICE_PRINCIPAL_CACHE_TTL", 0.0)
+    util.lookup_service_principal("my-sp")
+    assert len(calls) == 3
+
+
+def test_lookup_service_principals_batches_graph_query(monkeypatch):
+    queries = []
+
+    def fake_query(odata_filter):
+        queries.append(odata_filter)
+        return [
+            {"appId": "1", "displayName": "SP-One"},
+            {"appId": "2", "displayName": "sp-two"},
+        ]
+
+    monkeypatch.setattr("cfa.cloudops.util._graph_query_service_principals", fake_query)
+    monkeypatch.setattr(
+        "cfa.cloudops.util._graph_list_service_principals",
+        lambda name: [{"appId": "cached", "displayName": name}],
+    )
+    util.lookup_service_principal("sp-cached")
+
+    names = ["sp-one", "sp-two", "o'brien", "sp-cached", "sp-one"]
+    result = util.lookup_service_principals(names)
+
+    assert list(result) == ["sp-one", "sp-two", "o'brien", "sp-cached"]
+    assert result["sp-one"] == [{"appId": "1", "displayName": "SP-One"}]
+    assert result["sp-two"] == [{"appId": "2", "displayName": "sp-two"}]
+    assert result["o'brien"] == []
+    assert result["sp-cached"][0]["appId"] == "cached"
+    assert queries == ["displayName in ('sp-one', 'sp-two', 'o''brien')"]
+
+    # fetched names are now served from the cache
+    assert util.lookup_service_principal("sp-two")[0]["appId"] == "2"
+    assert len(queries) == 1
+
+
+def test_lookup_service_principals_chunks_and_falls_back(monkeypatch):
+    queries = []
+    monkeypatch.setattr(
+        "cfa.cloudops.util._graph_query_service_principals",
+        lambda odata_filter: queries.append(odata_filter) or [],
+    )
+    names = [f"sp-{i}" for i in range(20)]
+    util.lookup_service_principals(names, use_cache=False)
+    assert len(queries) == 2
+
+    def boom(names):
+        raise RuntimeError("graph down")
+
+    monkeypatch.setattr(
+        "cfa.cloudops.util._graph_list_service_principals_for_names", boom
+    )
+    monkeypatch.setattr(
+        "cfa.cloudops.util._query_service_principals",
+        lambda name: [{"appId": name}],
+    )
+    assert util.lookup_service_principals(["a", "b"]) == {
+        "a": [{"appId": "a"}],
+        "b": [{"appId": "b"}],
+    }
+
+
+def test_graph_list_service_principals_escapes_and_pages(monkeypatch):
+    pages = {
+        "first": {"value": [{"appId": "a"}], "@odata.nextLink": "https://next"},
+        "https://next": {"value": [{"appId": "b"}]},
+    }
+    sent = []
+
+    class FakeResponse:
+        def __init__(self, body):
+            self.body = body
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return self.body
+
+    class FakeClient:
+        def send_request(self, request):
+            sent.append(request.url)
+            key = "first" if len(sent) == 1 else request.url
+            return FakeResponse(pages[key])
+
+    monkeypatch.setattr(
+        "cfa.cloudops.util._get_graph_pipeline_client", lambda: FakeClient()
+    )
+
+    result = util._graph_list_service_principals("o'brien")
+
+    assert result == [{"appId": "a"}, {"appId": "b"}]
+    assert "displayName eq 'o''brien'" in sent[0]
+    assert sent[1] == "https://next"
+
+
 def test_lookup_available_vm_skus_for_batch_to_dict(monkeypatch):
     sku1 = SimpleNamespace(
         name="Standard_D2s_v3",
@@ -56,6 +241,95 @@ def test_lookup_available_vm_skus_for_batch_to_dict(monkeypatch):
     assert result[0]["vCPUs"] == "2"
 
 
+def test_lookup_available_vm_skus_for_batch_single_pass(monkeypatch):
+    sku = SimpleNamespace(
+        name="Standard_D2s_v3",
+        family_name="fam",
+        batch_support_end_of_life=None,
+        additional_properties={},
+        capabilities=[],
+    )
+    # a pager can only be walked once
+    client = SimpleNamespace(
+        location=SimpleNamespace(
+            list_supported_virtual_machine_skus=lambda **kwargs: iter([sku, sku])
+        )
+    )
+    monkeypatch.setattr("cfa.cloudops.util.get_config_val", lambda *a, **k: "eastus")
+
+    result = util.lookup_available_vm_skus_for_batch(client=client, to_dict=True)
+
+    assert [r["name"] for r in result] == ["Standard_D2s_v3", "Standard_D2s_v3"]
+
+
+def test_lookup_available_vm_skus_for_batch_caches_listing(monkeypatch):
+    sku = SimpleNamespace(
+        name="Standard_D2s_v3",
+        family_name="fam",
+        batch_support_end_of_life=None,
+        additional_properties={},
+        capabilities=[],
+    )
+    calls = []
+
+    def list_skus(**kwargs):
+        calls.append(kwargs)
+        return iter([sku])
+
+    client = SimpleNamespace(
+        location=SimpleNamespace(list_supported_virtual_machine_skus=list_skus)
+    )
+    config = {"azure_batch_location": "eastus", "azure_subscription_id": "sub-1"}
+
+    def lookup(config_dict=config, **kwargs):
+        return util.lookup_available_vm_skus_for_batch(
+            client=client, config_dict=config_dict, try_env=False, **kwargs
+        )
+
+    as_dicts = lookup()
+    raw = lookup(to_dict=False)
+    assert as_dicts[0]["name"] == "Standard_D2s_v3"
+    assert raw == [sku]
+    assert len(calls) == 1
+
+    lookup(use_cache=False)
+    lookup(filter="x")
+    assert len(calls) == 3
+
+    lookup(config_dict={**config, "azure_subscription_id": "sub-2"})
+    assert len(calls) == 4
+
+    # Without a configured subscription, listings are never cached
+    no_subscription = {"azure_batch_location": "eastus"}
+    lookup(config_dict=no_subscription)
+    lookup(config_dict=no_subscription)
+    assert len(calls) == 6
+    assert len(util._sku_cache) == 3
+
+
+def test_lookup_available_vm_skus_for_batch_cache_evicts(monkeypatch):
+    client = SimpleNamespace(
+        location=SimpleNamespace(list_supported_virtual_machine_skus=lambda **k: [])
+    )
+    monkeypatch.setattr("cfa.cloudops.util.get_config_val", lambda *a, **k: "eastus")
+    monkeypatch.setattr(util, "_SKU_CACHE_MAX_ENTRIES", 2)
+    now = [0.0]
+    monkeypatch.setattr(util.time, "monotonic", lambda: now[0])
+
+    util.lookup_available_vm_skus_for_batch(client=client, filter="a")
+    util.lookup_available_vm_skus_for_batch(client=client, filter="b")
+    util.lookup_available_vm_skus_for_batch(client=client, filter="c")
+    assert [k[2] for k in util._sku_cache] == [
+        (("filter", "b"),),
+        (("filter", "c"),),
+    ]
+    assert all(client not in entry for entry in util._sku_cache.values())
+
+    now[0] = util._SKU_CACHE_TTL
+    util.lookup_available_vm_skus_for_batch(client=client, filter="d")
+    assert [k[2] for k in util._sku_cache] == [(("filter", "d"),)]
+
+
 def test_lookup_available_vm_skus_for_batch_builds_client(monkeypatch):
     sku = SimpleNamespace(
         name="Standard_D2s_v3",
@@ -77,10 +351,40 @@ def test_lookup_available_vm_skus_for_batch_builds_client(monkeypatch):
     )
     monkeypatch.setattr("cfa.cloudops.util.get_config_val", lambda *a, **k: "eastus")
 
+    util.clear_sku_cache()
     result = util.lookup_available_vm_skus_for_batch(client=None, to_dict=False)
+    util.clear_sku_cache()
     assert result == [sku]
 
 
+def test_lookup_available_vm_skus_for_batch_caches_client(monkeypatch):
+    client = SimpleNamespace(
+        location=SimpleNamespace(list_supported_virtual_machine_skus=lambda **k: [])
+    )
+    calls = {"client": 0, "config": 0}
+
+    def fake_client(**kwargs):
+        calls["client"] += 1
+        return client
+
+    def fake_config(*args, **kwargs):
+        calls["config"] += 1
+        return "eastus"
+
+    monkeypatch.setattr("cfa.cloudops.client.get_batch_management_client", fake_client)
+    monkeypatch.setattr("cfa.cloudops.util.get_config_val", fake_config)
+
+    util.clear_sku_cache()
+    util.lookup_available_vm_skus_for_batch(config_dict={"a": "1"})
+    util.lookup_available_vm_skus_for_batch(config_dict={"a": "1"})
+    assert calls == {"client": 1, "config": 2}
+
+    # unhashable config values skip the cache
+    util.lookup_available_vm_skus_for_batch(config_dict={"a": ["1"]})
+    assert calls == {"client": 2, "config": 4}
+    util.clear_sku_cache()
+
+
 def test_credential_handler_require_attr():
     ch = auth.CredentialHandler()
 
@@ -363,6 +667,56 @@ def test_get_keyvault_vars_none_and_success(monkeypatch):
     assert seen["force"] is True
 
 
+def test_load_dotenv_parses_each_file_version_once(monkeypatch, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("CLOUDOPS_TEST_VAR=first\n")
+    monkeypatch.delenv("CLOUDOPS_TEST_VAR", raising=False)
+    auth._read_dotenv.cache_clear()
+    calls = []
+    real_dotenv_values = auth.dotenv_values
+    monkeypatch.setattr(
+        "cfa.cloudops.auth.dotenv_values",
+        lambda path, **kwargs: calls.append(path) or real_dotenv_values(path, **kwargs),
+    )
+
+    auth._load_dotenv(str(env_file))
+    auth._load_dotenv(str(env_file))
+    assert os.environ["CLOUDOPS_TEST_VAR"] == "first"
+    assert len(calls) == 1
+
+    os.environ["CLOUDOPS_TEST_VAR"] = "kept"
+    auth._load_dotenv(str(env_file), override=False)
+    assert os.environ["CLOUDOPS_TEST_VAR"] == "kept"
+
+    env_file.write_text("CLOUDOPS_TEST_VAR=second\n")
+    os.utime(env_file, ns=(0, os.stat(env_file).st_mtime_ns + 1))
+    auth._load_dotenv(str(env_file))
+    assert os.environ["CLOUDOPS_TEST_VAR"] == "second"
+    assert len(calls) == 2
+
+
+def test_load_dotenv_interpolates_at_load_time(monkeypatch, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "CLOUDOPS_TEST_BASE=${CLOUDOPS_TEST_SRC}\n"
+        "CLOUDOPS_TEST_DERIVED=${CLOUDOPS_TEST_BASE}/sub\n"
+    )
+    auth._read_dotenv.cache_clear()
+    monkeypatch.setenv("CLOUDOPS_TEST_SRC", "one")
+    monkeypatch.delenv("CLOUDOPS_TEST_BASE", raising=False)
+    monkeypatch.delenv("CLOUDOPS_TEST_DERIVED", raising=False)
+
+    auth._load_dotenv(str(env_file))
+    assert os.environ["CLOUDOPS_TEST_BASE"] == "one"
+    assert os.environ["CLOUDOPS_TEST_DERIVED"] == "one/sub"
+
+    monkeypatch.setenv("CLOUDOPS_TEST_SRC", "two")
+    auth._load_dotenv(str(env_file))
+    assert os.environ["CLOUDOPS_TEST_BASE"] == "two"
+    assert os.environ["CLOUDOPS_TEST_DERIVED"] == "two/sub"
+    assert auth._read_dotenv.cache_info().misses == 1
+
+
 def test_load_env_vars(monkeypatch):
     class FakeSub:
         subscription_id = "sub-1"
@@ -4,10 +4,10 @@ from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 from azure.batch import models
-from azure.storage.blob import BlobProperties
 
 from cfa.cloudops.batch_helpers import (
     add_task,
+    add_task_collection,
     check_mount_format,
     construct_vm_name,
     download_job_stats,
@@ -26,26 +26,11 @@ from cfa.cloudops.batch_helpers import (
 
 
 @pytest.fixture
-def mock_griddle():
+def mock_griddle(fake_blobs):
     with patch(
         "azure.storage.blob.ContainerClient",
         return_value=MagicMock(),
     ) as mock_client:
-        fake_blob_properties = [
-            {"name": "my_test_1.txt", "size": 100},
-            {"name": "my_test_2.txt", "size": 200},
-            {"name": "not_my_test_1.csv", "size": 250},
-            {"name": "not_my_test_2.json", "size": 50},
-            {"name": "large_file_1.parquet", "size": 1e9},
-            {"name": "large_file_2.parquet", "size": 2e9},
-        ]
-        fake_blobs = []
-        for fake in fake_blob_properties:
-            fake_blob = BlobProperties()
-            fake_blob.name = fake["name"]
-            fake_blob.size = fake["size"]
-            fake_blobs.append(fake_blob)
-
         mock_client.list_blobs = MagicMock(return_value=fake_blobs)
         yield mock_client
 
@@ -62,10 +47,9 @@ def test_monitor_tasks_all_successful():
     ]
     mock_batch_client.list_tasks.return_value = mock_tasks
 
-    with patch("time.sleep", return_value=None):
-        all_successful = monitor_tasks(
-            job_name="my-job", timeout=30, batch_client=mock_batch_client
-        )
+    all_successful = monitor_tasks(
+        job_name="my-job", timeout=30, batch_client=mock_batch_client
+    )
 
     assert all_successful["completed"] is True
 
@@ -85,7 +69,23 @@ def test_monitor_tasks_missing_job_execution_info():
     assert result["terminate_reason"] is None
 
 
-def test_add_task():
+@pytest.mark.parametrize(
+    "kwargs,exact_command_line",
+    [
+        ({}, True),
+        ({"depends_on": ["task-base--0"]}, True),
+        ({"depends_on": ["task-base--0"], "run_dependent_tasks_on_fail": True}, False),
+        (
+            {
+                "depends_on": ["task-base--0"],
+                "run_dependent_tasks_on_fail": True,
+                "mounts": [{"source": "my-source", "target": "/mnt/data"}],
+            },
+            False,
+        ),
+    ],
+)
+def test_add_task(kwargs, exact_command_line):
     mock_batch_client = MagicMock()
     task_id_base = "task-base"
     command_line = '/bin/bash -c "echo Hello World"'
@@ -95,48 +95,40 @@ def test_add_task():
         job_name="my-job",
         task_id_base=task_id_base,
         command_line=command_line,
+        **kwargs,
     )
 
     mock_batch_client.create_task.assert_called_once()
     added_task = mock_batch_client.create_task.call_args[0][1]
     assert added_task.id == "task-base--1"
-    assert added_task.command_line == command_line
+    if exact_command_line:
+        assert added_task.command_line == command_line
+    else:
+        assert added_task.command_line.startswith("/bin/bash")
 
-    add_task(
-        batch_client=mock_batch_client,
-        job_name="my-job",
-        task_id_base=task_id_base,
-        command_line=command_line,
-        depends_on=["task-base--0"],
-    )
-    added_task = mock_batch_client.create_task.call_args[0][1]
-    assert added_task.id == "task-base--1"
-    assert added_task.command_line == command_line
 
-    add_task(
-        batch_client=mock_batch_client,
-        job_name="my-job",
-        task_id_base=task_id_base,
-        command_line=command_line,
-        depends_on=["task-base--0"],
-        run_dependent_tasks_on_fail=True,
-    )
-    added_task = mock_batch_client.create_task.call_args[0][1]
-    assert added_task.id == "task-base--1"
-    assert added_task.command_line.startswith("/bin/bash")
+def test_add_task_collection_uses_chunked_create_tasks():
+    mock_batch_client = MagicMock()
+    tasks = [
+        {"command_line": f"echo {i}", "full_container_name": "app:latest"}
+        for i in range(150)
+    ]
 
-    add_task(
-        batch_client=mock_batch_client,
+    add_task_collection(
         job_name="my-job",
-        task_id_base=task_id_base,
-        command_line=command_line,
-        depends_on=["task-base--0"],
-        run_dependent_tasks_on_fail=True,
-        mounts=[{"source": "my-source", "target": "/mnt/data"}],
+        task_id_base="task-base",
+        tasks=tasks,
+        batch_client=mock_batch_client,
+        max_concurrency=4,
     )
-    added_task = mock_batch_client.create_task.call_args[0][1]
-    assert added_task.id == "task-base--1"
-    assert added_task.command_line.startswith("/bin/bash")
+
+    mock_batch_client.create_task_collection.assert_not_called()
+    mock_batch_client.create_tasks.assert_called_once()
+    job_name, added_tasks = mock_batch_client.create_tasks.call_args[0]
+    assert job_name == "my-job"
+    assert len(added_tasks) == 150
+    assert added_tasks[-1].id == "task-base--150"
+    assert mock_batch_client.create_tasks.call_args.kwargs["max_concurrency"] == 4
 
 
 def test_get_pool_mounts():
@@ -181,8 +173,7 @@ def test_get_rel_mnt_path():
     assert rel_path == "ERROR!"
 
 
-def test_get_args_from_yaml():
-    yaml_content = """
+_YAML_FIXTURE = """
     job:
       id: test-job
       pool_info:
@@ -191,18 +182,22 @@ def test_get_args_from_yaml():
         id: job-manager-task
         command_line: /bin/bash -c 'echo Hello World'
     """
-    with patch("builtins.open", mock_open(read_data=yaml_content)):
+_PARSED_YAML_FIXTURE = [
+    {
+        "id": "test-job",
+        "pool_info": {"pool_id": "test-pool"},
+        "job_manager_task": {
+            "id": "job-manager-task",
+            "command_line": "/bin/bash -c 'echo Hello World'",
+        },
+    }
+]
+
+
+def test_get_args_from_yaml():
+    with patch("builtins.open", mock_open(read_data=_YAML_FIXTURE)):
         with patch("griddler.parse", return_value=MagicMock()) as mock_parse:
-            mock_parse.to_dict.return_value = [
-                {
-                    "id": "test-job",
-                    "pool_info": {"pool_id": "test-pool"},
-                    "job_manager_task": {
-                        "id": "job-manager-task",
-                        "command_line": "/bin/bash -c 'echo Hello World'",
-                    },
-                }
-            ]
+            mock_parse.to_dict.return_value = _PARSED_YAML_FIXTURE
             args = get_args_from_yaml("test.yaml")
 
             assert type(args) is list
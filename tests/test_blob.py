@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import anyio
 import pytest
 from azure.mgmt.batch import models as mgmt_models
-from shared_fixtures import FAKE_BLOBS, MockLogger
+from shared_fixtures import MockLogger
 
 from cfa.cloudops.blob import (
     _async_download_blob_folder,
@@ -20,6 +20,11 @@ from cfa.cloudops.blob import (
 )
 
 
+async def _async_iter_blobs(items):
+    for item in items:
+        yield item
+
+
 @pytest.fixture(autouse=True)
 def mock_logging(monkeypatch):
     """
@@ -31,30 +36,22 @@ def mock_logging(monkeypatch):
 
 
 @pytest.fixture
-def mock_container_client():
+def mock_container_client(fake_blobs):
     with patch(
         "azure.storage.blob.ContainerClient",
         return_value=MagicMock(),
     ) as mock_client:
-        mock_client.list_blobs = MagicMock(return_value=FAKE_BLOBS)
+        mock_client.list_blobs = MagicMock(return_value=fake_blobs)
         yield mock_client
 
 
 @pytest.fixture
-def mock_async_container_client():
+def mock_async_container_client(fake_blobs):
     with patch(
         "azure.storage.blob.aio.ContainerClient",
         return_value=MagicMock(),
     ) as mock_client:
-
-        def make_async_iter(items):
-            async def gen():
-                for item in items:
-                    yield item
-
-            return gen()
-
-        mock_client.list_blobs = lambda *args, **kwargs: make_async_iter(FAKE_BLOBS)
+        mock_client.list_blobs = lambda *args, **kwargs: _async_iter_blobs(fake_blobs)
         yield mock_client
 
 
@@ -63,8 +60,8 @@ def mock_compute_node():
     return mgmt_models.ComputeNodeIdentityReference(resource_id="mock-resource-id")
 
 
-@pytest.fixture
-def mock_blob_service_client():
+@pytest.fixture(scope="module")
+def shared_blob_service_client():
     with patch(
         "cfa.cloudops._cloudclient.get_blob_service_client",
         return_value=MagicMock(),
@@ -72,6 +69,42 @@ def mock_blob_service_client():
         yield mock_client
 
 
+@pytest.fixture
+def mock_blob_service_client(shared_blob_service_client):
+    """
+    Reuse the module's patched blob service client with its state cleared.
+    """
+    shared_blob_service_client.reset_mock(return_value=True, side_effect=True)
+    return shared_blob_service_client
+
+
+class AsyncFileCtx:
+    async def __aenter__(self):
+        return MagicMock()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+@pytest.fixture(scope="module")
+def async_blob_clients():
+    mock_blob_client = AsyncMock()
+    mock_blob_client.upload_blob = AsyncMock()
+    mock_container_client = MagicMock()
+    mock_container_client.get_blob_client = MagicMock(return_value=mock_blob_client)
+    return mock_container_client, mock_blob_client
+
+
+@pytest.fixture
+def async_blob_client_factory(async_blob_clients):
+    """
+    Hand out the module's shared async blob client mocks with cleared call history.
+    """
+    for mock_client in async_blob_clients:
+        mock_client.reset_mock()
+    return lambda: async_blob_clients
+
+
 def test_get_node_mount_config_success(mock_compute_node):
     mounts = get_node_mount_config(
         storage_containers=["mock-container-1", "mock-container-2"],
@@ -295,6 +328,22 @@ def test_upload_to_storage_container(mocker, mock_blob_service_client):
         )
 
 
+def test_upload_to_storage_container_max_concurrency(mocker):
+    mocker.patch("builtins.open", mocker.mock_open(read_data="Some data"))
+    blob_service_client = MagicMock()
+
+    upload_to_storage_container(
+        file_paths="large.log",
+        blob_storage_container_name="my-blob-storage-container",
+        blob_service_client=blob_service_client,
+        max_concurrency=8,
+    )
+
+    blob_client = blob_service_client.get_blob_client.return_value
+    _, kwargs = blob_client.upload_blob.call_args
+    assert kwargs["max_concurrency"] == 8
+
+
 def test_download_from_storage_container(mocker, mock_blob_service_client):
     mocker.patch("builtins.open", mocker.mock_open(read_data="Some data"))
     with patch("cfa.cloudops.blob.logger") as mock_logger:
@@ -344,22 +393,14 @@ def test_update_blob_protection(mock_blob_service_client, mock_logging):
 
 
 @pytest.mark.asyncio
-async def test__async_upload_file_to_blob_success(tmp_path, mocker):
+async def test__async_upload_file_to_blob_success(
+    tmp_path, mocker, async_blob_client_factory
+):
     file_path = tmp_path / "testfile.txt"
     file_path.write_text("hello world")
     anyio_file_path = anyio.Path(str(file_path))
     semaphore = anyio.Semaphore(1)
-    mock_blob_client = AsyncMock()
-    mock_blob_client.upload_blob = AsyncMock()
-    mock_container_client = MagicMock()
-    mock_container_client.get_blob_client = MagicMock(return_value=mock_blob_client)
-
-    class AsyncFileCtx:
-        async def __aenter__(self):
-            return MagicMock()
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
+    mock_container_client, mock_blob_client = async_blob_client_factory()
 
     async def fake_open(mode):
         return AsyncFileCtx()
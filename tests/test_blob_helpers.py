@@ -1,7 +1,7 @@
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
-from shared_fixtures import FAKE_BLOBS, MockLogger
+from shared_fixtures import MockLogger
 
 from cfa.cloudops.blob_helpers import (
     download_file,
@@ -23,25 +23,25 @@ def mock_logging(monkeypatch):
 
 
 @pytest.fixture
-def mock_get_blob_service_client():
+def mock_get_blob_service_client(fake_blobs):
     with patch(
         "cfa.cloudops._cloudclient.get_blob_service_client",
         return_value=MagicMock(),
     ) as mock_client:
         mock_container_client = MagicMock()
         mock_container_client.exists.return_value = True
-        mock_container_client.list_blobs.return_value = iter(FAKE_BLOBS)
+        mock_container_client.list_blobs.return_value = iter(fake_blobs)
         mock_client.get_container_client.return_value = mock_container_client
         yield mock_client
 
 
 @pytest.fixture
-def mock_get_container_client():
+def mock_get_container_client(fake_blobs):
     with patch(
         "azure.storage.blob.ContainerClient",
         return_value=MagicMock(),
     ) as mock_client:
-        mock_client.list_blobs = MagicMock(return_value=FAKE_BLOBS)
+        mock_client.list_blobs = MagicMock(return_value=fake_blobs)
         yield mock_client
 
 
@@ -213,9 +213,11 @@ def test_upload_files_in_folder_fail():
             )
 
 
-def test_download_folder(mocker, mock_get_blob_service_client, mock_logging):
+def test_download_folder(
+    mocker, mock_get_blob_service_client, mock_logging, fake_blobs
+):
     with patch(
-        "cfa.cloudops.blob_helpers.list_blobs_in_container", return_value=FAKE_BLOBS
+        "cfa.cloudops.blob_helpers.list_blobs_in_container", return_value=fake_blobs
     ):
         mocker.patch(
             "cfa.cloudops.blob_helpers.check_virtual_directory_existence",
@@ -241,8 +243,8 @@ def test_download_folder(mocker, mock_get_blob_service_client, mock_logging):
         assert len(mock_logging.messages) > 0
 
 
-def test_download_folder_large(mocker, mock_get_blob_service_client):
-    large_files = [large for large in FAKE_BLOBS if large.size >= 1]
+def test_download_folder_large(mocker, mock_get_blob_service_client, fake_blobs):
+    large_files = [large for large in fake_blobs if large.size >= 1]
     mocker.patch(
         "cfa.cloudops.blob_helpers.check_virtual_directory_existence", return_value=True
     )
@@ -300,11 +302,11 @@ def test_download_folder_fail():
             )
 
 
-def test_download_file(mocker, mock_get_container_client):
+def test_download_file(mocker, mock_get_container_client, fake_blobs):
     mocker.patch("builtins.input", return_value="N")
     mock_stream = MagicMock()
     mock_stream.readall.return_value = b"Some data"
-    large_files = [large for large in FAKE_BLOBS if large.size >= 1]
+    large_files = [large for large in fake_blobs if large.size >= 1]
     mock_get_container_client.list_blobs.return_value = iter(large_files)
     mocker.patch("cfa.cloudops.blob_helpers.read_blob_stream", return_value=mock_stream)
     with patch("builtins.open", return_value=MagicMock()) as mock_file:
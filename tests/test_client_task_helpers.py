@@ -1,7 +1,9 @@
 import json
 import logging
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+import anyio
 import pytest
 from azure.batch.models import BatchNodeIdentityReference
 
@@ -153,7 +155,24 @@ def test_get_container_settings_with_mounts_and_registry(monkeypatch):
     assert "target=/app/output" in settings.container_run_options
 
 
+def test_get_container_settings_joins_run_options():
+    settings = task.get_container_settings(
+        container_image_name="app:latest",
+        mount_pairs=[
+            {"source": "input", "target": "/app/input"},
+            {"source": "output", "target": "/app/output"},
+        ],
+    )
+
+    assert settings.container_run_options == (
+        "--mount type=bind,source=/mnt/batch/tasks/fsmounts/input,target=/app/input "
+        "--mount type=bind,source=/mnt/batch/tasks/fsmounts/output,target=/app/output"
+    )
+    assert task.get_container_settings("app:latest").container_run_options == ""
+
+
 def test_output_task_files_to_blob_uses_default_identity(monkeypatch):
+    task.clear_identity_cache()
     mgmt_id = SimpleNamespace(
         resource_id="/subscriptions/sub/resourceGroups/rg/providers/id"
     )
@@ -170,6 +189,7 @@ def test_output_task_files_to_blob_uses_default_identity(monkeypatch):
         blob_account="acct",
         path="job/task",
     )
+    task.clear_identity_cache()
 
     assert output.file_pattern == "*.txt"
     container = output.destination.container
@@ -178,6 +198,41 @@ def test_output_task_files_to_blob_uses_default_identity(monkeypatch):
     assert container.container_url == "https://acct.blob.core.windows.net/logs"
 
 
+def test_output_task_files_to_blob_looks_up_default_identity_once(monkeypatch):
+    task.clear_identity_cache()
+    calls = []
+    mgmt_id = SimpleNamespace(
+        resource_id="/subscriptions/sub/resourceGroups/rg/providers/id"
+    )
+
+    def fake_lookup():
+        calls.append(1)
+        return mgmt_id
+
+    monkeypatch.setattr(
+        "cfa.cloudops.task.get_compute_node_identity_reference", fake_lookup
+    )
+
+    for i in range(3):
+        task.output_task_files_to_blob(
+            file_pattern="*.txt",
+            blob_container="logs",
+            blob_account="acct",
+            path=f"job/task-{i}",
+        )
+    explicit = BatchNodeIdentityReference(resource_id="/explicit")
+    output = task.output_task_files_to_blob(
+        file_pattern="*.txt",
+        blob_container="logs",
+        blob_account="acct",
+        compute_node_identity_reference=explicit,
+    )
+    task.clear_identity_cache()
+
+    assert len(calls) == 1
+    assert output.destination.container.identity_reference is explicit
+
+
 def test_output_task_files_to_blob_type_error():
     with pytest.raises(TypeError):
         task.output_task_files_to_blob(
@@ -466,3 +521,309 @@ def test_upload_docker_image_not_found(monkeypatch):
 
     with pytest.raises(helpers.docker.errors.ImageNotFound):
         helpers.upload_docker_image("local:latest", "reg", "repo")
+
+
+def test_get_task_configs_bulk_chunks_specs():
+    specs = [{"task_id": f"task-{i}", "base_call": f"echo {i}"} for i in range(250)]
+
+    chunks = list(task.get_task_configs_bulk(specs))
+
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+    assert chunks[0][0].id == "task-0"
+    assert chunks[-1][-1].command_line == "echo 249"
+    assert list(task.get_task_configs_bulk([])) == []
+
+    with pytest.raises(ValueError):
+        task.get_task_configs_bulk(specs, chunk_size=101)
+
+
+def test_make_log_output_file_factory_builds_per_task_paths():
+    node_id = BatchNodeIdentityReference(resource_id="/identity")
+    log_factory = task.make_log_output_file_factory(
+        log_blob_container="logs",
+        log_blob_account="acct",
+        log_subdir="jobs/run-1",
+        compute_node_identity_reference=node_id,
+    )
+
+    first = log_factory("task-1")
+    cfg = task.get_task_config(
+        task_id="task-2",
+        base_call="python app.py",
+        log_output_file_factory=log_factory,
+    )
+    second = cfg.output_files[0]
+
+    assert first.destination.container.path == "jobs/run-1/task-1"
+    assert second.destination.container.path == "jobs/run-1/task-2"
+    assert second.destination.container.identity_reference is node_id
+    assert (
+        second.destination.container.container_url
+        == "https://acct.blob.core.windows.net/logs"
+    )
+    assert second.upload_options is first.upload_options
+    assert (
+        task.make_log_output_file_factory(
+            "logs", "acct", compute_node_identity_reference=node_id
+        )("task-3").destination.container.path
+        == "task-3"
+    )
+
+
+def test_build_tasks_parallel_preserves_order():
+    specs = [{"task_id": f"task-{i}", "base_call": f"echo {i}"} for i in range(50)]
+
+    tasks = task.build_tasks_parallel(specs, max_workers=4)
+
+    assert [t.id for t in tasks] == [f"task-{i}" for i in range(50)]
+    assert task.build_tasks_parallel([]) == []
+
+
+@pytest.mark.parametrize(
+    "log_subdir,expected",
+    [
+        ("", "task-1"),
+        ("jobs", "jobs/task-1"),
+        ("jobs/run-1/", "jobs/run-1/task-1"),
+        (None, "task-1"),
+        ("jobs\\run-1", "jobs/run-1/task-1"),
+        ("jobs\\run-1\\", "jobs/run-1/task-1"),
+        ("./logs", "logs/task-1"),
+        ("a//b", "a/b/task-1"),
+        ("logs/.", "logs/task-1"),
+        (".", "task-1"),
+    ],
+)
+def test_join_log_path(log_subdir, expected):
+    prefix = task._log_path_prefix(log_subdir)
+    assert task._join_log_path(prefix, "task-1") == expected
+
+
+def test_log_output_file_factory_normalizes_windows_subdir():
+    log_factory = task.make_log_output_file_factory(
+        "logs",
+        "acct",
+        log_subdir="jobs\\run-1",
+        compute_node_identity_reference=BatchNodeIdentityReference(
+            resource_id="/identity"
+        ),
+    )
+
+    assert log_factory("task-1").destination.container.path == "jobs/run-1/task-1"
+
+
+def test_task_spec_converts_in_bulk():
+    node_id = BatchNodeIdentityReference(resource_id="/identity")
+    log_factory = task.make_log_output_file_factory(
+        "logs", "acct", log_subdir="run", compute_node_identity_reference=node_id
+    )
+    specs = [
+        task.TaskSpec(
+            task_id=f"task-{i}",
+            base_call=f"echo {i}",
+            container_image_name="app:latest",
+            mount_pairs=(("input", "/app/input"),),
+            log_output_file_factory=log_factory,
+        )
+        for i in range(3)
+    ]
+
+    (chunk,) = task.get_task_configs_bulk(specs)
+
+    assert not hasattr(specs[0], "__dict__")
+    assert [cfg.id for cfg in chunk] == ["task-0", "task-1", "task-2"]
+    assert chunk[0].container_settings.image_name == "app:latest"
+    assert "target=/app/input" in chunk[0].container_settings.container_run_options
+    assert chunk[2].output_files[0].destination.container.path == "run/task-2"
+    assert (
+        task.TaskSpec("t", "echo").to_task_create_options().container_settings is None
+    )
+
+
+def test_get_task_config_reuses_default_user_identity():
+    first = task.get_task_config(task_id="task-1", base_call="echo 1")
+    second = task.get_task_config(task_id="task-2", base_call="echo 2")
+
+    assert first.user_identity is second.user_identity
+    assert first.user_identity.auto_user.scope.name.lower() == "pool"
+
+
+def test_make_log_output_file_factory_validates_identity_once():
+    with pytest.raises(TypeError):
+        task.make_log_output_file_factory(
+            "logs", "acct", compute_node_identity_reference="not-a-node-id"
+        )
+
+
+def test_get_container_settings_caches_identical_settings():
+    mounts = [{"source": "input", "target": "/app/input"}]
+    first = task.get_container_settings("app:latest", mount_pairs=mounts)
+    second = task.get_container_settings(
+        "app:latest", mount_pairs=[{"target": "/app/input", "source": "input"}]
+    )
+    other = task.get_container_settings("app:v2", mount_pairs=mounts)
+    uncached = task.get_container_settings(
+        "app:latest", mount_pairs=mounts, cache=False
+    )
+
+    assert first is second
+    assert other is not first
+    assert uncached is not first
+    assert uncached.container_run_options == first.container_run_options
+
+
+def test_get_container_settings_accepts_mount_pair_objects():
+    from_dicts = task.get_container_settings(
+        "app:latest",
+        mount_pairs=[{"source": "input", "target": "/app/input"}],
+        cache=False,
+    )
+    from_pairs = task.get_container_settings(
+        "app:latest",
+        mount_pairs=[task.MountPair(source="input", target="/app/input")],
+        cache=False,
+    )
+
+    assert from_pairs.container_run_options == from_dicts.container_run_options
+    assert not hasattr(task.MountPair("a", "/b"), "__dict__")
+    assert task.MountPair.from_dict({"source": "a", "target": "/b"}) == (
+        task.MountPair("a", "/b")
+    )
+
+
+def test_log_output_file_factory_outputs_are_independent():
+    log_factory = task.make_log_output_file_factory(
+        "logs",
+        "acct",
+        compute_node_identity_reference=BatchNodeIdentityReference(
+            resource_id="/identity"
+        ),
+    )
+    first = log_factory("task-1")
+    second = log_factory("task-2")
+
+    first.destination.container.path = "changed"
+
+    assert second.destination.container.path == "task-2"
+    assert type(second) is type(first)
+
+
+def test_output_task_files_to_blob_omits_empty_path():
+    output = task.output_task_files_to_blob(
+        file_pattern="*.txt",
+        blob_container="logs",
+        blob_account="acct",
+        path="",
+        compute_node_identity_reference=BatchNodeIdentityReference(
+            resource_id="/identity"
+        ),
+    )
+
+    assert output.destination.container.path is None
+    assert "path" not in output.destination.container.as_dict()
+
+
+def test_submit_tasks_async_limits_concurrent_requests():
+    in_flight = []
+    peak = []
+
+    class FakeAsyncBatchClient:
+        async def create_tasks(self, job_id, task_collection):
+            in_flight.append(job_id)
+            peak.append(len(in_flight))
+            await anyio.sleep(0.01)
+            in_flight.pop()
+            return [t.id for t in task_collection]
+
+    specs = [{"task_id": f"task-{i}", "base_call": f"echo {i}"} for i in range(450)]
+
+    results = anyio.run(
+        task.submit_tasks_async, FakeAsyncBatchClient(), "my-job", specs, 2
+    )
+
+    assert [len(r) for r in results] == [100, 100, 100, 100, 50]
+    assert max(peak) == 2
+
+
+def test_submit_tasks_async_keeps_results_after_failed_chunk():
+    error = RuntimeError("chunk failed")
+
+    class FakeAsyncBatchClient:
+        async def create_tasks(self, job_id, task_collection):
+            first = task_collection[0].id
+            if first == "task-100":
+                raise error
+            # Finish the first chunk last so completion order differs
+            await anyio.sleep(0.02 if first == "task-0" else 0)
+            return [t.id for t in task_collection]
+
+    specs = [{"task_id": f"task-{i}", "base_call": f"echo {i}"} for i in range(250)]
+
+    results = anyio.run(
+        task.submit_tasks_async, FakeAsyncBatchClient(), "my-job", specs, 3
+    )
+
+    assert results[0] == [f"task-{i}" for i in range(100)]
+    assert results[1] is error
+    assert results[2] == [f"task-{i}" for i in range(200, 250)]
+
+
+def test_submit_task_collection_sends_one_request_per_chunk():
+    batch_client = MagicMock()
+    specs = [{"task_id": f"task-{i}", "base_call": f"echo {i}"} for i in range(250)]
+
+    results = task.submit_task_collection(batch_client, "my-job", specs)
+
+    assert len(results) == 3
+    assert batch_client.create_tasks.call_count == 3
+    sizes = [len(c.args[1]) for c in batch_client.create_tasks.call_args_list]
+    assert sizes == [100, 100, 50]
+    assert all(not c.kwargs for c in batch_client.create_tasks.call_args_list)
+    batch_client.create_task.assert_not_called()
+
+
+def test_submit_task_collection_keeps_results_after_failed_chunk():
+    error = RuntimeError("chunk failed")
+
+    class FakeBatchClient:
+        def create_tasks(self, job_id, task_collection):
+            if task_collection[0].id == "task-100":
+                raise error
+            return [t.id for t in task_collection]
+
+    specs = [{"task_id": f"task-{i}", "base_call": f"echo {i}"} for i in range(250)]
+
+    results = task.submit_task_collection(FakeBatchClient(), "my-job", specs)
+
+    assert results[0] == [f"task-{i}" for i in range(100)]
+    assert results[1] is error
+    assert results[2] == [f"task-{i}" for i in range(200, 250)]
+
+
+def test_get_container_settings_skips_debug_formatting_when_disabled(caplog):
+    class NoStrList(list):
+        def __str__(self):
+            raise AssertionError("debug message was formatted")
+
+        __repr__ = __str__
+
+    caplog.set_level(logging.INFO, logger="cfa.cloudops.task")
+    settings = task.get_container_settings(
+        "app:latest",
+        mount_pairs=NoStrList([{"source": "input", "target": "/app/input"}]),
+        cache=False,
+    )
+
+    assert "target=/app/input" in settings.container_run_options
+
+
+def test_create_bind_mount_strings_matches_scalar_helper():
+    pairs = [task.MountPair("src", "/app"), {"source": "out", "target": "/out"}]
+
+    mounts = task.create_bind_mount_strings("/mnt", pairs)
+
+    assert mounts == [
+        task.create_bind_mount_string("/mnt", "src", "/app"),
+        task.create_bind_mount_string("/mnt", "out", "/out"),
+    ]
+    assert task.create_bind_mount_strings("/mnt", []) == []
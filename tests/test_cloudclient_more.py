@@ -299,6 +299,35 @@ def test_download_after_job_dispatches_file_and_folder(cloud_client_more, monkey
     assert len(calls["folder"]) == 1
 
 
+def test_download_after_job_downloads_paths_concurrently(
+    cloud_client_more, monkeypatch
+):
+    downloaded = []
+    monkeypatch.setattr(
+        "cfa.cloudops._cloudclient.batch_helpers.monitor_tasks", lambda **kwargs: None
+    )
+    monkeypatch.setattr(
+        "cfa.cloudops._cloudclient.os.makedirs", lambda *args, **kwargs: None
+    )
+    cloud_client_more.download_file = lambda **kwargs: downloaded.append(
+        kwargs["src_path"]
+    )
+    cloud_client_more.download_folder = lambda **kwargs: downloaded.append(
+        kwargs["src_path"]
+    )
+
+    paths = ["a.txt", "b.txt", "folder1", "folder2"]
+    cloud_client_more.download_after_job(
+        job_name="job-1",
+        blob_paths=paths,
+        target="./downloads",
+        container_name="cont",
+        max_workers=3,
+    )
+
+    assert sorted(downloaded) == sorted(paths)
+
+
 def test_get_kv_secret_success_and_failure(cloud_client_more, monkeypatch):
     monkeypatch.setattr(
         "cfa.cloudops._cloudclient.SecretClient",
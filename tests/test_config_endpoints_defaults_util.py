@@ -57,6 +57,20 @@ def test_construct_https_url():
     assert (
         endpoints._construct_https_url("example.com", "/v1") == "https://example.com/v1"
     )
+    assert endpoints._construct_https_url("example.com", "v1") == (
+        "https://example.com/v1"
+    )
+    assert endpoints._construct_https_url("my host.com") == "https://my%20host.com"
+
+
+def test_account_endpoint_constructors_are_cached():
+    endpoints.construct_batch_endpoint.cache_clear()
+    for _ in range(3):
+        endpoints.construct_batch_endpoint("acct", "eastus")
+    info = endpoints.construct_batch_endpoint.cache_info()
+    endpoints.construct_batch_endpoint.cache_clear()
+
+    assert (info.misses, info.hits) == (1, 2)
 
 
 def test_batch_blob_and_registry_endpoint_constructors():
@@ -83,6 +97,28 @@ def test_batch_blob_and_registry_endpoint_constructors():
     )
 
 
+def test_construct_blob_container_endpoint_is_cached(monkeypatch):
+    endpoints.construct_blob_container_endpoint.cache_clear()
+    calls = []
+    original = endpoints.construct_blob_account_endpoint
+
+    def counting_account_endpoint(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(
+        endpoints, "construct_blob_account_endpoint", counting_account_endpoint
+    )
+
+    urls = {
+        endpoints.construct_blob_container_endpoint("logs", "storage") for _ in range(5)
+    }
+    endpoints.construct_blob_container_endpoint.cache_clear()
+
+    assert urls == {"https://storage.blob.core.windows.net/logs"}
+    assert len(calls) == 1
+
+
 @pytest.mark.parametrize(
     "endpoint,expected_valid,expected_substring",
     [
@@ -90,6 +126,8 @@ def test_batch_blob_and_registry_endpoint_constructors():
         ("https://myregistry.azurecr.io/", False, "trailing slash"),
         ("https://myregistry.example.com", False, "azurecr.io"),
         ("https://azurecr.io", False, "subdomain"),
+        ("https://myregistry.azurecr.io/repo", True, None),
+        ("myregistry.azurecr.io", False, "Got ``"),
     ],
 )
 def test_is_valid_acr_endpoint(endpoint, expected_valid, expected_substring):
@@ -170,6 +208,24 @@ def test_ensure_listlike_behaviors():
     assert util.ensure_listlike(5) == [5]
 
 
+def test_ensure_listlike_copies_tuples_to_list():
+    result = util.ensure_listlike(("a", "b"))
+    assert result == ["a", "b"]
+    assert isinstance(result, list)
+    assert util._coerce_pair(("a",), ("b", "c")) == ["a", "b", "c"]
+
+
+def test_coerce_pair_concatenates_into_new_list():
+    data = ["a", "b"]
+    result = util._coerce_pair(data, "c")
+    assert result == ["a", "b", "c"]
+    assert result is not data
+    assert data == ["a", "b"]
+    assert util._coerce_pair("a", ["b", "c"]) == ["a", "b", "c"]
+    assert util._coerce_pair("a", "b") == ["a", "b"]
+    assert util._coerce_pair([], []) == []
+
+
 def test_sku_to_dict_handles_capabilities_and_properties():
     sku = SimpleNamespace(
         name="Standard_D2s_v3",
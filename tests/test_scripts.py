@@ -1,7 +1,38 @@
+import argparse
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
 from shared_fixtures import FAKE_COMMANDLINE
 
 import cfa.cloudops.scripts as scripts
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python 3.10
+    import tomli as tomllib
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    scripts._get_client.cache_clear()
+    yield
+    scripts._get_client.cache_clear()
+
+
+def test_get_client_is_cached(mocker):
+    init = mocker.patch(
+        "cfa.cloudops._cloudclient.CloudClient.__init__", return_value=None
+    )
+    first = scripts._get_client(".env.test", True, False)
+    second = scripts._get_client(".env.test", True, False)
+    other = scripts._get_client(".env.other", True, False)
+    assert first is second
+    assert other is not first
+    assert init.call_count == 2
+
 
 def test_create_pool(mocker, monkeypatch):
     monkeypatch.setattr(
@@ -173,7 +204,8 @@ def test_misc_new_scripts(mocker, monkeypatch):
 
     monkeypatch.setattr(
         "sys.argv",
-        FAKE_COMMANDLINE + ["--source_path", "a.txt", "--container_name", "c1"],
+        FAKE_COMMANDLINE
+        + ["--source_path", "a.txt", "--container_name", "container-1"],
     )
     mocker.patch(
         "cfa.cloudops._cloudclient.CloudClient.update_blob_protection",
@@ -246,6 +278,25 @@ def test_hello(monkeypatch, capsys):
     assert "Hello, Tester!" in captured.out
 
 
+def test_hello_variants(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["script_name.py"])
+    scripts.hello()
+    assert "Hello, World!" in capsys.readouterr().out
+
+    monkeypatch.setattr("sys.argv", ["script_name.py", "--name=Tester"])
+    scripts.hello()
+    assert "Hello, Tester!" in capsys.readouterr().out
+
+    monkeypatch.setattr("sys.argv", ["script_name.py", "--help"])
+    scripts.hello()
+    assert "--name NAME" in capsys.readouterr().out
+
+    monkeypatch.setattr("sys.argv", ["script_name.py", "--bogus"])
+    with pytest.raises(SystemExit) as exc:
+        scripts.hello()
+    assert exc.value.code == 2
+
+
 def test_create_blob_container(mocker, monkeypatch):
     monkeypatch.setattr(
         "sys.argv", FAKE_COMMANDLINE + ["--container_name", "my-container"]
@@ -458,3 +509,298 @@ def test_add_tasks_from_yaml(mocker, monkeypatch, tmp_path):
         "cfa.cloudops._cloudclient.CloudClient.add_tasks_from_yaml", return_value=None
     )
     scripts.add_tasks_from_yaml()
+
+
+def test_import_does_not_load_cloudclient():
+    code = (
+        "import sys, cfa.cloudops.scripts; "
+        "assert 'cfa.cloudops._cloudclient' not in sys.modules"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+    assert result.returncode == 0, result.stderr.decode()
+
+
+def test_main_dispatches_to_command(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["cloudops", "hello", "--name", "Tester"])
+    scripts.main()
+    assert "Hello, Tester!" in capsys.readouterr().out
+
+    monkeypatch.setattr("sys.argv", ["cloudops"])
+    scripts.main()
+    assert "create_pool" in capsys.readouterr().out
+
+    monkeypatch.setattr("sys.argv", ["cloudops", "not-a-command"])
+    with pytest.raises(SystemExit) as exc:
+        scripts.main()
+    assert exc.value.code == 2
+
+
+def test_main_builds_only_selected_parser(mocker, monkeypatch):
+    build = mocker.spy(scripts, "_create_pool_parser")
+    other = mocker.spy(scripts, "_create_job_parser")
+    mocker.patch.object(scripts, "_get_client")
+    monkeypatch.setattr(
+        "sys.argv",
+        ["cloudops", "create-pool", "--pool_name", "p", "--container_image_name", "i"],
+    )
+    scripts.main()
+    assert build.call_count == 1
+    assert other.call_count == 0
+
+
+def test_parsers_are_cached():
+    assert scripts._create_pool_parser() is scripts._create_pool_parser()
+    assert scripts._create_job_parser() is not scripts._create_pool_parser()
+
+
+def test_create_pool_mounts_are_parsed(mocker, monkeypatch):
+    client = mocker.patch.object(scripts, "_get_client").return_value
+    monkeypatch.setattr(
+        "sys.argv",
+        FAKE_COMMANDLINE
+        + [
+            "--pool_name",
+            "test-pool",
+            "--container_image_name",
+            "test-image",
+            "--mounts",
+            "input",
+            "output:results",
+        ],
+    )
+    scripts.create_pool()
+    assert client.create_pool.call_args.kwargs["mounts"] == [
+        {"source": "input", "target": "input"},
+        {"source": "output", "target": "results"},
+    ]
+
+
+def test_add_task_depends_on_range_is_parsed(mocker, monkeypatch):
+    client = mocker.patch.object(scripts, "_get_client").return_value
+    monkeypatch.setattr(
+        "sys.argv",
+        FAKE_COMMANDLINE
+        + [
+            "--job_name",
+            "test-job",
+            "--command_line",
+            "echo hi",
+            "--depends_on",
+            "task-1",
+            "task-2",
+            "--depends_on_range",
+            "10-20",
+        ],
+    )
+    scripts.add_task()
+    kwargs = client.add_task.call_args.kwargs
+    assert kwargs["depends_on"] == ["task-1", "task-2"]
+    assert kwargs["depends_on_range"] == (10, 20)
+
+    monkeypatch.setattr(
+        "sys.argv",
+        FAKE_COMMANDLINE
+        + ["--job_name", "j", "--command_line", "c", "--depends_on_range", "10"],
+    )
+    with pytest.raises(SystemExit):
+        scripts.add_task()
+
+
+def test_parse_task_range_requires_separator():
+    assert scripts._parse_task_range("3:7") == (3, 7)
+    with pytest.raises(argparse.ArgumentTypeError, match="separator"):
+        scripts._parse_task_range("10")
+
+
+def test_all_parsers_build_without_option_conflicts():
+    builders = [
+        getattr(scripts, name)
+        for name in dir(scripts)
+        if name.endswith("_parser") and hasattr(getattr(scripts, name), "cache_clear")
+    ]
+    assert builders
+    for build in builders:
+        parser = build()
+        option_strings = [
+            opt for action in parser._actions for opt in action.option_strings
+        ]
+        assert len(option_strings) == len(set(option_strings)), build.__name__
+
+
+def test_add_tasks_from_yaml_short_flags():
+    args = scripts._add_tasks_from_yaml_parser().parse_args(
+        ["-f", "-j", "job", "-c", "echo", "-fp", "tasks.yaml"]
+    )
+    assert args.use_federated is True
+    assert args.file_path == "tasks.yaml"
+
+
+def test_generate_sample_env(monkeypatch, tmp_path, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "cloudops-sample.env").write_text("stale contents that are longer")
+    scripts.generate_sample_env()
+    contents = (tmp_path / "cloudops-sample.env").read_text()
+    assert contents.startswith("# This file is saved as cloudops-sample.env.")
+    assert 'AZURE_BATCH_ACCOUNT="your azure batch account name"\n' in contents
+    assert contents.endswith('registry name"\n')
+    assert "created successfully" in capsys.readouterr().out
+
+
+def test_script_help_exits_cleanly(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["create_pool", "-h"])
+    with pytest.raises(SystemExit) as exc:
+        scripts.create_pool()
+    assert exc.value.code == 0
+    out = capsys.readouterr().out
+    assert "Create a resource pool" in out
+    assert "--dotenv_path" in out
+
+
+@pytest.mark.parametrize(
+    "extra, key, expected",
+    [
+        (["--command_line=-h"], "command_line", "-h"),
+        (["--command_line", "run", "--depends_on=-h"], "depends_on", ["-h"]),
+    ],
+)
+def test_script_help_flag_as_option_value(mocker, monkeypatch, extra, key, expected):
+    client = mocker.patch.object(scripts, "_get_client").return_value
+    monkeypatch.setattr("sys.argv", FAKE_COMMANDLINE + ["--job_name", "j"] + extra)
+    scripts.add_task()
+    assert client.add_task.call_args.kwargs[key] == expected
+
+
+def test_script_help_flag_missing_option_value_is_an_error(mocker, monkeypatch):
+    get_client = mocker.patch.object(scripts, "_get_client")
+    monkeypatch.setattr(
+        "sys.argv", FAKE_COMMANDLINE + ["--job_name", "j", "--command_line", "-h"]
+    )
+    with pytest.raises(SystemExit) as exc:
+        scripts.add_task()
+    assert exc.value.code != 0
+    get_client.assert_not_called()
+
+
+def test_script_parsers_reject_abbreviations():
+    with pytest.raises(SystemExit):
+        scripts._delete_pool_parser().parse_args(["--pool", "p"])
+
+
+def test_get_transport_is_shared():
+    transport = scripts._get_transport()
+    assert transport is scripts._get_transport()
+    transport.close()
+    assert transport.session is not None
+
+
+def test_upload_file_multiple_sources(mocker, monkeypatch):
+    client = mocker.patch.object(scripts, "_get_client").return_value
+    monkeypatch.setattr(
+        "sys.argv",
+        FAKE_COMMANDLINE
+        + [
+            "--container_name",
+            "test-container",
+            "--source_path",
+            "a.txt",
+            "b.txt",
+            "c.txt",
+        ],
+    )
+    scripts.upload_file()
+    uploaded = sorted(call.kwargs["files"] for call in client.upload_files.mock_calls)
+    assert uploaded == ["a.txt", "b.txt", "c.txt"]
+
+
+def test_entry_points_are_defined_once():
+    tree = ast.parse(Path(scripts.__file__).read_text())
+    names = [
+        node.name
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+    assert len(names) == len(set(names))
+
+    pyproject = Path(scripts.__file__).parents[2] / "pyproject.toml"
+    entry_points = tomllib.loads(pyproject.read_text())["project"]["scripts"]
+    for target in entry_points.values():
+        module, _, func = target.partition(":")
+        if module == scripts.__name__:
+            assert callable(getattr(scripts, func)), target
+
+
+def test_create_pool_and_job_args_are_typed_records(mocker, monkeypatch):
+    client = mocker.patch.object(scripts, "_get_client").return_value
+    monkeypatch.setattr(
+        "sys.argv",
+        FAKE_COMMANDLINE
+        + ["--pool_name", "test-pool", "--container_image_name", "test-image"],
+    )
+    scripts.create_pool()
+    assert client.create_pool.call_args.kwargs["vm_size"] == "standard_d4s_v3"
+
+    monkeypatch.setattr(
+        "sys.argv",
+        FAKE_COMMANDLINE + ["--job_name", "test-job", "--pool_name", "test-pool"],
+    )
+    scripts.create_job()
+    assert client.create_job.call_args.kwargs["mark_complete_after_tasks_run"]
+
+    fields = set(scripts._CreatePoolArgs._fields)
+    parser_dests = {
+        action.dest
+        for action in scripts._create_pool_parser()._actions
+        if action.default is not argparse.SUPPRESS
+    }
+    assert fields == parser_dests
+    fields = set(scripts._CreateJobArgs._fields)
+    parser_dests = {
+        action.dest
+        for action in scripts._create_job_parser()._actions
+        if action.default is not argparse.SUPPRESS
+    }
+    assert fields == parser_dests
+
+
+@pytest.mark.parametrize(
+    "name, valid",
+    [
+        ("my-container", True),
+        ("abc", True),
+        ("$root", True),
+        ("$web", True),
+        ("$logs", True),
+        ("$other", False),
+        ("ab", False),
+        ("My-Container", False),
+        ("my--container", False),
+        ("-container", False),
+        ("container-", False),
+        ("a" * 64, False),
+    ],
+)
+def test_container_name_validation(name, valid):
+    args = ["--container_name", name]
+    if valid:
+        parsed = scripts._list_blob_files_parser().parse_args(args)
+        assert parsed.container_name == name
+    else:
+        with pytest.raises(SystemExit):
+            scripts._list_blob_files_parser().parse_args(args)
+
+
+def test_job_name_validation(mocker):
+    get_client = mocker.patch.object(scripts, "_get_client")
+    parser = scripts._delete_job_parser()
+    assert parser.parse_args(["--job_name", "my job_1"]).job_name == "my job_1"
+    for bad in ["job/1", "a" * 65, ""]:
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--job_name", bad])
+    get_client.assert_not_called()
+
+
+def test_every_command_has_a_description():
+    for command in scripts._COMMANDS.values():
+        assert scripts._DESCRIPTIONS[command.__name__]
+    with pytest.raises(TypeError):
+        scripts._DESCRIPTIONS["hello"] = "changed"